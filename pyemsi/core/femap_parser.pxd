@@ -17,21 +17,27 @@ cdef class FEMAPBlock:
 cdef class FEMAPParser:
     cdef str filepath
     cdef public dict blocks
+    cdef dict _cache
     cdef str BLOCK_DELIMITER
     
     cdef void _parse(self)
+    @staticmethod
+    cdef void _store_block(dict blocks, int block_id, list block_lines)
     
     @staticmethod
     cdef list _parse_csv_line_fast(str line)
     @staticmethod
+    cdef tuple _load_node_block(FEMAPBlock block)
+    @staticmethod
     cdef tuple _locate_output_vector_header(list lines, int start_index)
     cdef list _get_output_vector_blocks(self)
     
     cpdef dict parse(self)
+    cpdef void invalidate(self)
     cpdef list get_blocks(self, int block_id)
     cpdef dict get_header(self)
     cpdef dict get_nodes(self, bint force_2d=*)
-    cpdef tuple get_nodes_arrays(self)
+    cpdef tuple get_nodes_arrays(self, bint force_2d=*)
     cpdef dict get_properties(self)
     cpdef list get_elements(self)
     cpdef tuple get_elements_arrays(self)
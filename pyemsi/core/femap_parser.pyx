@@ -18,6 +18,58 @@ np.import_array()
 
 from typing import Dict, List, Tuple, Optional
 
+# States of the streaming block parser in FEMAPParser._parse
+cdef enum:
+    _SEEK_DELIMITER = 0
+    _EXPECT_BLOCK_ID = 1
+    _IN_BLOCK = 2
+
+
+cdef Py_ssize_t _scan_node_ids(str line, int[::1] out, Py_ssize_t pos) except -1:
+    """
+    Write the non-zero integers of a comma/whitespace separated node line.
+
+    Walks the characters directly instead of splitting the line and calling
+    ``int()`` per field. Values are stored in ``out`` starting at ``pos``
+    (the caller guarantees room for ``len(line)`` values) and the new end
+    position is returned. Raises ValueError on anything but digits, signs
+    and separators.
+    """
+    cdef Py_UCS4 ch
+    cdef long long value = 0
+    cdef int sign = 0
+    cdef bint in_number = False
+
+    for ch in line:
+        if u"0" <= ch <= u"9":
+            value = value * 10 + (<int>ch - 48)  # 48 == ord("0")
+            if value > 2147483647:
+                raise OverflowError(f"Node ID out of range in line: {line!r}")
+            in_number = True
+        elif ch == u"," or ch == u" " or ch == u"\t" or ch == u"\r" or ch == u"\n":
+            if in_number:
+                if value != 0:
+                    out[pos] = -value if sign < 0 else value
+                    pos += 1
+                value = 0
+                in_number = False
+            elif sign != 0:
+                raise ValueError(f"Invalid node ID in line: {line!r}")
+            sign = 0
+        elif (ch == u"-" or ch == u"+") and not in_number and sign == 0:
+            sign = -1 if ch == u"-" else 1
+        else:
+            raise ValueError(f"Invalid node ID in line: {line!r}")
+
+    if in_number:
+        if value != 0:
+            out[pos] = -value if sign < 0 else value
+            pos += 1
+    elif sign != 0:
+        raise ValueError(f"Invalid node ID in line: {line!r}")
+
+    return pos
+
 
 cdef class FEMAPBlock:
     """Represents a single FEMAP data block."""
@@ -40,6 +92,7 @@ cdef class FEMAPParser:
     def __init__(self, str filepath):
         self.filepath = filepath
         self.blocks = {}
+        self._cache = {}
         self.BLOCK_DELIMITER = "   -1"  # 3 spaces + -1
         self._parse()
 
@@ -47,60 +100,57 @@ cdef class FEMAPParser:
         """
         Parse the FEMAP file and populate blocks grouped by ID.
         Internal cdef method for performance.
+
+        The file is streamed line by line through a small state machine
+        (seek delimiter -> expect block ID -> collect block lines), so only
+        the parsed blocks are held in memory rather than a full copy of
+        the file.
         """
-        cdef list lines
-        cdef int i, n_lines, block_id
-        cdef str line, next_line
-        cdef list block_lines
-        cdef FEMAPBlock block
+        cdef int state = _SEEK_DELIMITER
+        cdef int block_id = 0
+        cdef str raw, line, delimiter = self.BLOCK_DELIMITER
+        cdef list block_lines = []
+        cdef dict blocks = self.blocks
 
         with open(self.filepath, "r") as f:
-            lines = f.readlines()
-
-        n_lines = len(lines)
-        i = 0
-        
-        while i < n_lines:
-            line = (<str>lines[i]).rstrip("\n")
-
-            # Check for block delimiter
-            if line == self.BLOCK_DELIMITER:
-                # Next line should contain block ID
-                if i + 1 < n_lines:
-                    next_line = (<str>lines[i + 1]).strip()
-
-                    # Skip if next line is also a delimiter (double delimiter)
-                    if next_line == "-1":
-                        i += 1
+            for raw in f:
+                line = raw.rstrip("\n")
+
+                if state == _IN_BLOCK:
+                    # Read until next delimiter
+                    if line == delimiter:
+                        FEMAPParser._store_block(blocks, block_id, block_lines)
+                        state = _SEEK_DELIMITER
+                    else:
+                        block_lines.append(line)
+
+                elif state == _EXPECT_BLOCK_ID:
+                    # Skip if this line is also a delimiter (double delimiter)
+                    if line.strip() == "-1":
+                        state = _EXPECT_BLOCK_ID if line == delimiter else _SEEK_DELIMITER
                         continue
 
                     try:
-                        block_id = int(next_line)
-                        # Collect block content
-                        block_lines = []
-                        i += 2  # Skip delimiter and ID line
+                        block_id = int(line)
+                    except ValueError:
+                        state = _SEEK_DELIMITER
+                        continue
 
-                        # Read until next delimiter
-                        while i < n_lines:
-                            line = (<str>lines[i]).rstrip("\n")
-                            if line == self.BLOCK_DELIMITER:
-                                i += 1
-                                break
-                            block_lines.append(line)
-                            i += 1
+                    block_lines = []
+                    state = _IN_BLOCK
 
-                        # Store block
-                        block = FEMAPBlock(block_id, block_lines)
-                        if block_id not in self.blocks:
-                            self.blocks[block_id] = []
-                        (<list>self.blocks[block_id]).append(block)
+                elif line == delimiter:
+                    # Next line should contain block ID
+                    state = _EXPECT_BLOCK_ID
 
-                    except ValueError:
-                        i += 1
-                else:
-                    i += 1
-            else:
-                i += 1
+        # A block left open at end of file is still stored
+        if state == _IN_BLOCK:
+            FEMAPParser._store_block(blocks, block_id, block_lines)
+
+    @staticmethod
+    cdef void _store_block(dict blocks, int block_id, list block_lines):
+        """Append a parsed block to the per-ID block list."""
+        (<list>blocks.setdefault(block_id, [])).append(FEMAPBlock(block_id, block_lines))
 
     cpdef dict parse(self):
         """
@@ -111,6 +161,17 @@ cdef class FEMAPParser:
         """
         return self.blocks
 
+    cpdef void invalidate(self):
+        """
+        Drop memoized ``get_*`` results.
+
+        Extracted nodes, elements, properties, materials and output sets
+        are computed once per parser and the same objects are returned on
+        later calls, so treat them as read-only. Call this after modifying
+        ``blocks`` to force the next getter call to re-extract.
+        """
+        self._cache.clear()
+
     @staticmethod
     cdef list _parse_csv_line_fast(str line):
         """
@@ -118,14 +179,19 @@ cdef class FEMAPParser:
         """
         cdef str stripped
         cdef list parts
-        
+
         stripped = line.rstrip(",").strip()
-        
-        if "," in stripped:
-            parts = [p.strip() for p in stripped.split(",") if p.strip()]
-        else:
-            parts = stripped.split()
-        
+
+        if "," not in stripped:
+            return stripped.split()
+
+        parts = stripped.split(",")
+        # Most records are bare "1,0,0,..." fields: skip the per-field
+        # strip() unless the line actually contains padding.
+        if " " in stripped or "\t" in stripped:
+            return [p for p in map(str.strip, parts) if p]
+        if "" in parts:
+            return [p for p in parts if p]
         return parts
 
     @staticmethod
@@ -169,6 +235,47 @@ cdef class FEMAPParser:
 
         return {"title": title if title != "<NULL>" else "", "version": version}
 
+    @staticmethod
+    cdef tuple _load_node_block(FEMAPBlock block):
+        """
+        Bulk-load one Block 403 into (ids, coords) arrays.
+
+        The block is handed to ``np.loadtxt`` in one go (comma separated
+        first, then whitespace separated). Blocks NumPy cannot load, e.g.
+        with truncated or malformed records, fall back to the tolerant
+        per-line parser, which skips bad lines.
+        """
+        cdef list parts, node_list, coord_list
+        cdef str line
+        cdef object data
+
+        if not block.lines:
+            return (np.empty(0, dtype=np.int64), np.empty((0, 3), dtype=np.float64))
+
+        for delimiter in (",", None):
+            try:
+                # loadtxt consumes the line list directly: no joined copy of the block
+                data = np.loadtxt(block.lines, delimiter=delimiter, usecols=(0, 11, 12, 13), ndmin=2)
+            except ValueError:
+                continue
+            return (data[:, 0].astype(np.int64), np.ascontiguousarray(data[:, 1:4]))
+
+        node_list = []
+        coord_list = []
+        for line in block.lines:
+            parts = FEMAPParser._parse_csv_line_fast(line)
+            if len(parts) >= 14:
+                try:
+                    node_list.append(int(parts[0]))
+                    coord_list.append((float(parts[11]), float(parts[12]), float(parts[13])))
+                except (ValueError, IndexError):
+                    continue
+
+        return (
+            np.array(node_list, dtype=np.int64),
+            np.array(coord_list, dtype=np.float64).reshape(-1, 3),
+        )
+
     cpdef dict get_nodes(self, bint force_2d=False):
         """
         Extract all nodes from Block 403.
@@ -179,67 +286,62 @@ cdef class FEMAPParser:
         Returns:
             Dictionary mapping node IDs to (x, y, z) coordinates
         """
+        cached = self._cache.get(("nodes", force_2d))
+        if cached is not None:
+            return cached
+
         cdef dict nodes = {}
-        cdef list all_blocks, parts
         cdef FEMAPBlock block
-        cdef str line
-        cdef int node_id
-        cdef double x, y, z
+        cdef object ids, coords
 
-        all_blocks = self.get_blocks(403)
-        for block in all_blocks:
-            for line in block.lines:
-                parts = FEMAPParser._parse_csv_line_fast(line)
-                if len(parts) >= 14:
-                    try:
-                        node_id = int(parts[0])
-                        x = float(parts[11])
-                        y = float(parts[12])
-                        z = float(parts[13])
-                        if force_2d:
-                            if z > 0.0:
-                                continue
-                        nodes[node_id] = (x, y, z)
-                    except (ValueError, IndexError):
-                        continue
+        for block in self.get_blocks(403):
+            ids, coords = FEMAPParser._load_node_block(block)
+            if force_2d:
+                keep = ~(coords[:, 2] > 0.0)
+                ids = ids[keep]
+                coords = coords[keep]
+            nodes.update(zip(ids.tolist(), map(tuple, coords.tolist())))
 
+        self._cache[("nodes", force_2d)] = nodes
         return nodes
 
-    cpdef tuple get_nodes_arrays(self):
+    cpdef tuple get_nodes_arrays(self, bint force_2d=False):
         """
         Extract all nodes from Block 403 as NumPy arrays (high performance).
 
+        Args:
+            force_2d: If True, skip nodes where z > 0.0 (same rule as get_nodes)
+
         Returns:
             Tuple of (node_ids: np.ndarray[int32], coords: np.ndarray[float64, (n,3)])
+            in file order; repeated node IDs are kept as-is
         """
-        cdef list all_blocks, parts, node_list, coord_list
+        cached = self._cache.get(("nodes_arrays", force_2d))
+        if cached is not None:
+            return cached
+
+        cdef list id_arrays = []
+        cdef list coord_arrays = []
         cdef FEMAPBlock block
-        cdef str line
-        cdef int node_id
-        cdef double x, y, z
+        cdef object ids, coords
 
-        node_list = []
-        coord_list = []
+        for block in self.get_blocks(403):
+            ids, coords = FEMAPParser._load_node_block(block)
+            if force_2d:
+                keep = ~(coords[:, 2] > 0.0)
+                ids = ids[keep]
+                coords = coords[keep]
+            id_arrays.append(ids)
+            coord_arrays.append(coords)
 
-        all_blocks = self.get_blocks(403)
-        for block in all_blocks:
-            for line in block.lines:
-                parts = FEMAPParser._parse_csv_line_fast(line)
-                if len(parts) >= 14:
-                    try:
-                        node_id = int(parts[0])
-                        x = float(parts[11])
-                        y = float(parts[12])
-                        z = float(parts[13])
-                        node_list.append(node_id)
-                        coord_list.append((x, y, z))
-                    except (ValueError, IndexError):
-                        continue
+        if not id_arrays:
+            return (np.empty(0, dtype=np.int32), np.empty((0, 3), dtype=np.float64))
 
-        cdef np.ndarray[np.int32_t, ndim=1] node_ids = np.array(node_list, dtype=np.int32)
-        cdef np.ndarray[np.float64_t, ndim=2] coords = np.array(coord_list, dtype=np.float64)
-        
-        return (node_ids, coords)
+        cdef np.ndarray[np.int32_t, ndim=1] node_ids = np.concatenate(id_arrays).astype(np.int32)
+        cdef np.ndarray[np.float64_t, ndim=2] coords_out = np.concatenate(coord_arrays)
+
+        self._cache[("nodes_arrays", force_2d)] = (node_ids, coords_out)
+        return (node_ids, coords_out)
 
     cpdef dict get_properties(self):
         """
@@ -248,6 +350,10 @@ cdef class FEMAPParser:
         Returns:
             Dictionary mapping property IDs to property metadata
         """
+        cached = self._cache.get("properties")
+        if cached is not None:
+            return cached
+
         cdef dict properties = {}
         cdef list all_blocks, parts
         cdef FEMAPBlock block
@@ -278,59 +384,43 @@ cdef class FEMAPParser:
                 else:
                     i += 1
 
+        self._cache["properties"] = properties
         return properties
 
     cpdef list get_elements(self):
         """
         Extract all elements from Block 404.
 
+        Thin wrapper over :meth:`get_elements_arrays` for callers that
+        expect one dictionary per element.
+
         Returns:
             List of element dictionaries with id, prop_id, topology, and nodes
         """
-        cdef list elements = []
-        cdef list all_blocks, parts, nodes, nodes1, nodes2
-        cdef FEMAPBlock block
-        cdef int i, elem_id, prop_id, topology, n_lines, n
-
-        all_blocks = self.get_blocks(404)
-        for block in all_blocks:
-            i = 0
-            n_lines = len(block.lines)
-            while i < n_lines:
-                parts = FEMAPParser._parse_csv_line_fast(<str>block.lines[i])
-                if len(parts) >= 5:
-                    try:
-                        elem_id = int(parts[0])
-                        prop_id = int(parts[2])
-                        topology = int(parts[4])
-
-                        nodes = []
-                        if i + 1 < n_lines:
-                            nodes1 = FEMAPParser._parse_csv_line_fast(<str>block.lines[i + 1])
-                            for nstr in nodes1:
-                                n = int(nstr)
-                                if n != 0:
-                                    nodes.append(n)
-
-                        if i + 2 < n_lines:
-                            nodes2 = FEMAPParser._parse_csv_line_fast(<str>block.lines[i + 2])
-                            for nstr in nodes2:
-                                n = int(nstr)
-                                if n != 0:
-                                    nodes.append(n)
-
-                        elements.append({
-                            "id": elem_id,
-                            "prop_id": prop_id,
-                            "topology": topology,
-                            "nodes": nodes,
-                        })
-                        i += 7
-                    except (ValueError, IndexError):
-                        i += 1
-                else:
-                    i += 1
-
+        cached = self._cache.get("elements")
+        if cached is not None:
+            return cached
+
+        cdef list ids, prop_ids, topologies, connectivity, offsets, elements
+        cdef Py_ssize_t k
+
+        elem_ids, elem_prop_ids, elem_topologies, elem_connectivity, elem_offsets = self.get_elements_arrays()
+        ids = elem_ids.tolist()
+        prop_ids = elem_prop_ids.tolist()
+        topologies = elem_topologies.tolist()
+        connectivity = elem_connectivity.tolist()
+        offsets = elem_offsets.tolist()
+
+        elements = [
+            {
+                "id": ids[k],
+                "prop_id": prop_ids[k],
+                "topology": topologies[k],
+                "nodes": connectivity[offsets[k]:offsets[k + 1]],
+            }
+            for k in range(len(ids))
+        ]
+        self._cache["elements"] = elements
         return elements
 
     cpdef tuple get_elements_arrays(self):
@@ -345,63 +435,88 @@ cdef class FEMAPParser:
             - connectivity: np.ndarray[int32] - flat node connectivity
             - offsets: np.ndarray[int32] - offsets into connectivity for each element
         """
-        cdef list all_blocks, parts, nodes1, nodes2
-        cdef list elem_ids_list = []
-        cdef list prop_ids_list = []
-        cdef list topo_list = []
-        cdef list connectivity_list = []
-        cdef list offsets_list = [0]
+        cached = self._cache.get("elements_arrays")
+        if cached is not None:
+            return cached
+
+        cdef list all_blocks, parts
         cdef FEMAPBlock block
-        cdef int i, elem_id, prop_id, topology, n_lines, n, offset
+        cdef list lines
+        cdef Py_ssize_t i, n_lines, n_elems, max_elems, pos, start
+        cdef int elem_id, prop_id, topology
+        cdef np.ndarray elem_ids, prop_ids, topologies, offsets, connectivity
+        cdef int[::1] ids_view, props_view, topo_view, offsets_view, conn_view
 
         all_blocks = self.get_blocks(404)
-        offset = 0
-        
+
+        # Each element record spans 7 lines, which bounds the element count
+        max_elems = 0
         for block in all_blocks:
+            max_elems += (len(block.lines) + 6) // 7
+
+        elem_ids = np.empty(max_elems, dtype=np.int32)
+        prop_ids = np.empty(max_elems, dtype=np.int32)
+        topologies = np.empty(max_elems, dtype=np.int32)
+        offsets = np.empty(max_elems + 1, dtype=np.int32)
+        connectivity = np.empty(max_elems * 20, dtype=np.int32)
+        ids_view = elem_ids
+        props_view = prop_ids
+        topo_view = topologies
+        offsets_view = offsets
+        conn_view = connectivity
+
+        n_elems = 0
+        pos = 0
+        start = 0
+        offsets_view[0] = 0
+        for block in all_blocks:
+            lines = block.lines
             i = 0
-            n_lines = len(block.lines)
+            n_lines = len(lines)
             while i < n_lines:
-                parts = FEMAPParser._parse_csv_line_fast(<str>block.lines[i])
+                parts = FEMAPParser._parse_csv_line_fast(<str>lines[i])
                 if len(parts) >= 5:
                     try:
                         elem_id = int(parts[0])
                         prop_id = int(parts[2])
                         topology = int(parts[4])
 
-                        elem_ids_list.append(elem_id)
-                        prop_ids_list.append(prop_id)
-                        topo_list.append(topology)
-
+                        # Scan both node lines before recording anything so a
+                        # malformed record leaves the arrays consistent.
+                        start = pos
                         if i + 1 < n_lines:
-                            nodes1 = FEMAPParser._parse_csv_line_fast(<str>block.lines[i + 1])
-                            for nstr in nodes1:
-                                n = int(nstr)
-                                if n != 0:
-                                    connectivity_list.append(n)
-                                    offset += 1
-
+                            if start + len(<str>lines[i + 1]) > conn_view.shape[0]:
+                                connectivity = np.resize(connectivity, 2 * (start + len(<str>lines[i + 1])))
+                                conn_view = connectivity
+                            pos = _scan_node_ids(<str>lines[i + 1], conn_view, pos)
                         if i + 2 < n_lines:
-                            nodes2 = FEMAPParser._parse_csv_line_fast(<str>block.lines[i + 2])
-                            for nstr in nodes2:
-                                n = int(nstr)
-                                if n != 0:
-                                    connectivity_list.append(n)
-                                    offset += 1
-
-                        offsets_list.append(offset)
-                        i += 7
-                    except (ValueError, IndexError):
+                            if pos + len(<str>lines[i + 2]) > conn_view.shape[0]:
+                                connectivity = np.resize(connectivity, 2 * (pos + len(<str>lines[i + 2])))
+                                conn_view = connectivity
+                            pos = _scan_node_ids(<str>lines[i + 2], conn_view, pos)
+                    except (ValueError, OverflowError):
+                        pos = start
                         i += 1
+                        continue
+
+                    ids_view[n_elems] = elem_id
+                    props_view[n_elems] = prop_id
+                    topo_view[n_elems] = topology
+                    n_elems += 1
+                    offsets_view[n_elems] = pos
+                    i += 7
                 else:
                     i += 1
 
-        return (
-            np.array(elem_ids_list, dtype=np.int32),
-            np.array(prop_ids_list, dtype=np.int32),
-            np.array(topo_list, dtype=np.int32),
-            np.array(connectivity_list, dtype=np.int32),
-            np.array(offsets_list, dtype=np.int32),
+        arrays = (
+            elem_ids[:n_elems].copy(),
+            prop_ids[:n_elems].copy(),
+            topologies[:n_elems].copy(),
+            connectivity[:pos].copy(),
+            offsets[: n_elems + 1].copy(),
         )
+        self._cache["elements_arrays"] = arrays
+        return arrays
 
     cpdef dict get_materials(self):
         """
@@ -410,6 +525,10 @@ cdef class FEMAPParser:
         Returns:
             Dictionary mapping material IDs to material metadata
         """
+        cached = self._cache.get("materials")
+        if cached is not None:
+            return cached
+
         cdef dict materials = {}
         cdef list all_blocks, parts
         cdef FEMAPBlock block
@@ -431,6 +550,7 @@ cdef class FEMAPParser:
                 else:
                     i += 1
 
+        self._cache["materials"] = materials
         return materials
 
     cpdef dict get_output_sets(self):
@@ -440,6 +560,10 @@ cdef class FEMAPParser:
         Returns:
             Dictionary mapping output set IDs to metadata
         """
+        cached = self._cache.get("output_sets")
+        if cached is not None:
+            return cached
+
         cdef dict output_sets = {}
         cdef list all_blocks, parts, value_parts
         cdef FEMAPBlock block
@@ -476,6 +600,7 @@ cdef class FEMAPParser:
                 else:
                     i += 1
 
+        self._cache["output_sets"] = output_sets
         return output_sets
 
     @staticmethod
@@ -1,216 +1,266 @@
 """Shared colormap registry for plotter-related dialogs."""
 
-CMAP_NAMES = {
+from functools import lru_cache
+from types import MappingProxyType
+
+# Colormap names grouped by category, in display order
+_CMAP_GROUPS = (
     # Linear (Sequential)
-    "viridis": "linear",
-    "haline": "linear",
-    "imola": "linear",
-    "navia": "linear",
-    "davos": "linear",
-    "lapaz": "linear",
-    "cividis": "linear",
-    "nuuk": "linear",
-    "lipari": "linear",
-    "thermal": "linear",
-    "plasma": "linear",
-    "bmy": "linear",
-    "inferno": "linear",
-    "magma": "linear",
-    "lajolla": "linear",
-    "copper": "linear",
-    "gist_heat": "linear",
-    "fire": "linear",
-    "afmhot": "linear",
-    "hot": "linear",
-    "solar": "linear",
-    "bilbao": "linear",
-    "pink": "linear",
-    "tokyo": "linear",
-    "dimgray": "linear",
-    "grayC": "linear",
-    "gray": "linear",
-    "gist_gray": "linear",
-    "bone": "linear",
-    "oslo": "linear",
-    "ice": "linear",
-    "devon": "linear",
-    "kbc": "linear",
-    "winter": "linear",
-    "bmw": "linear",
-    "acton": "linear",
-    "cubehelix": "linear",
-    "batlowW": "linear",
-    "batlowK": "linear",
-    "batlow": "linear",
-    "turku": "linear",
-    "bamako": "linear",
-    "bgyw": "linear",
-    "kbgyw": "linear",
-    "gouldian": "linear",
-    "bgy": "linear",
-    "kgy": "linear",
-    "summer": "linear",
-    "oxy": "linear",
-    "hawaii": "linear",
-    "buda": "linear",
-    "spring": "linear",
-    "autumn": "linear",
-    "Wistia": "linear",
-    "Oranges": "linear",
-    "YlOrBr": "linear",
-    "OrRd": "linear",
-    "YlOrRd": "linear",
-    "Reds": "linear",
-    "amp": "linear",
-    "PuRd": "linear",
-    "RdPu": "linear",
-    "matter": "linear",
-    "BuPu": "linear",
-    "Purples": "linear",
-    "dense": "linear",
-    "Blues": "linear",
-    "PuBu": "linear",
-    "PuBuGn": "linear",
-    "blues": "linear",
-    "GnBu": "linear",
-    "YlGnBu": "linear",
-    "tempo": "linear",
-    "rain": "linear",
-    "deep": "linear",
-    "gist_yarg": "linear",
-    "binary": "linear",
-    "Grays": "linear",
-    "turbid": "linear",
-    "algae": "linear",
-    "speed": "linear",
-    "YlGn": "linear",
-    "Greens": "linear",
-    "BuGn": "linear",
-    "cool": "linear",
-    "glasgow": "linear",
-    "kg": "linear",
-    "kb": "linear",
-    "kr": "linear",
+    (
+        "linear",
+        (
+            "viridis",
+            "haline",
+            "imola",
+            "navia",
+            "davos",
+            "lapaz",
+            "cividis",
+            "nuuk",
+            "lipari",
+            "thermal",
+            "plasma",
+            "bmy",
+            "inferno",
+            "magma",
+            "lajolla",
+            "copper",
+            "gist_heat",
+            "fire",
+            "afmhot",
+            "hot",
+            "solar",
+            "bilbao",
+            "pink",
+            "tokyo",
+            "dimgray",
+            "grayC",
+            "gray",
+            "gist_gray",
+            "bone",
+            "oslo",
+            "ice",
+            "devon",
+            "kbc",
+            "winter",
+            "bmw",
+            "acton",
+            "cubehelix",
+            "batlowW",
+            "batlowK",
+            "batlow",
+            "turku",
+            "bamako",
+            "bgyw",
+            "kbgyw",
+            "gouldian",
+            "bgy",
+            "kgy",
+            "summer",
+            "oxy",
+            "hawaii",
+            "buda",
+            "spring",
+            "autumn",
+            "Wistia",
+            "Oranges",
+            "YlOrBr",
+            "OrRd",
+            "YlOrRd",
+            "Reds",
+            "amp",
+            "PuRd",
+            "RdPu",
+            "matter",
+            "BuPu",
+            "Purples",
+            "dense",
+            "Blues",
+            "PuBu",
+            "PuBuGn",
+            "blues",
+            "GnBu",
+            "YlGnBu",
+            "tempo",
+            "rain",
+            "deep",
+            "gist_yarg",
+            "binary",
+            "Grays",
+            "turbid",
+            "algae",
+            "speed",
+            "YlGn",
+            "Greens",
+            "BuGn",
+            "cool",
+            "glasgow",
+            "kg",
+            "kb",
+            "kr",
+        ),
+    ),
     # Diverging
-    "coolwarm": "diverging",
-    "bkr": "diverging",
-    "bwr": "diverging",
-    "seismic": "diverging",
-    "balance": "diverging",
-    "berlin": "diverging",
-    "vik": "diverging",
-    "diff": "diverging",
-    "bky": "diverging",
-    "bwy": "diverging",
-    "lisbon": "diverging",
-    "bjy": "diverging",
-    "broc": "diverging",
-    "tofino": "diverging",
-    "cork": "diverging",
-    "delta": "diverging",
-    "PRGn": "diverging",
-    "vanimo": "diverging",
-    "bam": "diverging",
-    "PiYG": "diverging",
-    "RdYlGn": "diverging",
-    "Spectral": "diverging",
-    "BrBG": "diverging",
-    "RdYlBu": "diverging",
-    "RdBu": "diverging",
-    "roma": "diverging",
-    "PuOr": "diverging",
-    "managua": "diverging",
-    "tarn": "diverging",
-    "gwv": "diverging",
-    "RdGy": "diverging",
-    "curl": "diverging",
-    "cwr": "diverging",
+    (
+        "diverging",
+        (
+            "coolwarm",
+            "bkr",
+            "bwr",
+            "seismic",
+            "balance",
+            "berlin",
+            "vik",
+            "diff",
+            "bky",
+            "bwy",
+            "lisbon",
+            "bjy",
+            "broc",
+            "tofino",
+            "cork",
+            "delta",
+            "PRGn",
+            "vanimo",
+            "bam",
+            "PiYG",
+            "RdYlGn",
+            "Spectral",
+            "BrBG",
+            "RdYlBu",
+            "RdBu",
+            "roma",
+            "PuOr",
+            "managua",
+            "tarn",
+            "gwv",
+            "RdGy",
+            "curl",
+            "cwr",
+        ),
+    ),
     # Multi-Sequential
-    "topo": "multi-sequential",
-    "bukavu": "multi-sequential",
-    "oleron": "multi-sequential",
-    "fes": "multi-sequential",
+    (
+        "multi-sequential",
+        (
+            "topo",
+            "bukavu",
+            "oleron",
+            "fes",
+        ),
+    ),
     # Cyclic
-    "phase": "cyclic",
-    "cyclic_isoluminant": "cyclic",
-    "colorwheel": "cyclic",
-    "hsv": "cyclic",
-    "twilight": "cyclic",
-    "twilight_shifted": "cyclic",
-    "vikO": "cyclic",
-    "romaO": "cyclic",
-    "bamO": "cyclic",
-    "brocO": "cyclic",
-    "corkO": "cyclic",
+    (
+        "cyclic",
+        (
+            "phase",
+            "cyclic_isoluminant",
+            "colorwheel",
+            "hsv",
+            "twilight",
+            "twilight_shifted",
+            "vikO",
+            "romaO",
+            "bamO",
+            "brocO",
+            "corkO",
+        ),
+    ),
     # Categorical (Qualitative)
-    "glasbey": "categorical",
-    "glasbey_bw": "categorical",
-    "glasbey_cool": "categorical",
-    "glasbey_warm": "categorical",
-    "glasbey_dark": "categorical",
-    "glasbey_light": "categorical",
-    "glasbey_category10": "categorical",
-    "glasbey_hv": "categorical",
-    "grayCS": "categorical",
-    "bilbaoS": "categorical",
-    "lajollaS": "categorical",
-    "batlowWS": "categorical",
-    "budaS": "categorical",
-    "hawaiiS": "categorical",
-    "tokyoS": "categorical",
-    "nuukS": "categorical",
-    "naviaS": "categorical",
-    "davosS": "categorical",
-    "lapazS": "categorical",
-    "imolaS": "categorical",
-    "devonS": "categorical",
-    "osloS": "categorical",
-    "lipariS": "categorical",
-    "actonS": "categorical",
-    "turkuS": "categorical",
-    "batlowKS": "categorical",
-    "batlowS": "categorical",
-    "bamakoS": "categorical",
-    "glasgowS": "categorical",
-    "Accent": "categorical",
-    "Dark2": "categorical",
-    "Paired": "categorical",
-    "Pastel1": "categorical",
-    "Pastel2": "categorical",
-    "Set1": "categorical",
-    "Set2": "categorical",
-    "Set3": "categorical",
-    "tab10": "categorical",
-    "tab20": "categorical",
-    "tab20b": "categorical",
-    "tab20c": "categorical",
+    (
+        "categorical",
+        (
+            "glasbey",
+            "glasbey_bw",
+            "glasbey_cool",
+            "glasbey_warm",
+            "glasbey_dark",
+            "glasbey_light",
+            "glasbey_category10",
+            "glasbey_hv",
+            "grayCS",
+            "bilbaoS",
+            "lajollaS",
+            "batlowWS",
+            "budaS",
+            "hawaiiS",
+            "tokyoS",
+            "nuukS",
+            "naviaS",
+            "davosS",
+            "lapazS",
+            "imolaS",
+            "devonS",
+            "osloS",
+            "lipariS",
+            "actonS",
+            "turkuS",
+            "batlowKS",
+            "batlowS",
+            "bamakoS",
+            "glasgowS",
+            "Accent",
+            "Dark2",
+            "Paired",
+            "Pastel1",
+            "Pastel2",
+            "Set1",
+            "Set2",
+            "Set3",
+            "tab10",
+            "tab20",
+            "tab20b",
+            "tab20c",
+        ),
+    ),
     # Miscellaneous
-    "isolum": "miscellaneous",
-    "rainbow4": "miscellaneous",
-    "rainbow": "miscellaneous",
-    "gist_rainbow": "miscellaneous",
-    "jet": "miscellaneous",
-    "turbo": "miscellaneous",
-    "nipy_spectral": "miscellaneous",
-    "gist_ncar": "miscellaneous",
-    "CMRmap": "miscellaneous",
-    "brg": "miscellaneous",
-    "gist_stern": "miscellaneous",
-    "gnuplot": "miscellaneous",
-    "gnuplot2": "miscellaneous",
-    "ocean": "miscellaneous",
-    "gist_earth": "miscellaneous",
-    "terrain": "miscellaneous",
-    "prism": "miscellaneous",
-    "flag": "miscellaneous",
-}
+    (
+        "miscellaneous",
+        (
+            "isolum",
+            "rainbow4",
+            "rainbow",
+            "gist_rainbow",
+            "jet",
+            "turbo",
+            "nipy_spectral",
+            "gist_ncar",
+            "CMRmap",
+            "brg",
+            "gist_stern",
+            "gnuplot",
+            "gnuplot2",
+            "ocean",
+            "gist_earth",
+            "terrain",
+            "prism",
+            "flag",
+        ),
+    ),
+)
+
+# Flat parallel tuples: CMAP_CATEGORY_NAMES[CMAP_CATEGORY_IDS[i]] is the category of CMAP_NAME_LIST[i]
+CMAP_NAME_LIST = tuple(name for _, names in _CMAP_GROUPS for name in names)
+CMAP_CATEGORY_NAMES = tuple(kind for kind, _ in _CMAP_GROUPS)
+CMAP_CATEGORY_IDS = tuple(index for index, (_, names) in enumerate(_CMAP_GROUPS) for _ in names)
+_CMAP_INDEX = {name: index for index, name in enumerate(CMAP_NAME_LIST)}
+
+# Read-only name -> category mapping kept for callers that need dict access
+CMAP_NAMES = MappingProxyType(
+    {name: CMAP_CATEGORY_NAMES[category] for name, category in zip(CMAP_NAME_LIST, CMAP_CATEGORY_IDS)}
+)
 
-CMAP_CHOICES = tuple(f"{name} : {kind}" for name, kind in CMAP_NAMES.items())
+CMAP_CHOICES = tuple(
+    f"{name} : {CMAP_CATEGORY_NAMES[category]}" for name, category in zip(CMAP_NAME_LIST, CMAP_CATEGORY_IDS)
+)
 
 
 def cmap_choice_to_name(choice: str) -> str:
     return choice.split(" : ", 1)[0]
 
 
+@lru_cache(maxsize=256)
 def cmap_name_to_choice(name: str) -> str:
-    return f"{name} : {CMAP_NAMES.get(name, 'unknown')}"
+    index = _CMAP_INDEX.get(name)
+    category = CMAP_CATEGORY_NAMES[CMAP_CATEGORY_IDS[index]] if index is not None else "unknown"
+    return f"{name} : {category}"
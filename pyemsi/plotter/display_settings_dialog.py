@@ -1,38 +1,135 @@
 """Display settings dialog for PyVista plotter configuration."""
 
 from __future__ import annotations
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pyvistaqt import QtInteractor
     import pyvista as pv
 
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QDialog, QDialogButtonBox, QVBoxLayout
+from vtkmodules.vtkRenderingAnnotation import vtkCubeAxesActor
 
 from .colormaps import CMAP_CHOICES, cmap_name_to_choice
 from .color_utils import to_hex
 from pyemsi.widgets.property_tree_widget import PropertyTreeWidget
 
 
-def _grid_visibility_dict() -> dict[int, str]:
+# vtkCubeAxesActor enum values (the base class of pv.CubeAxesActor), bound once at import
+_GRID_LINES_ALL = vtkCubeAxesActor.VTK_GRID_LINES_ALL
+_GRID_LINES_CLOSEST = vtkCubeAxesActor.VTK_GRID_LINES_CLOSEST
+_GRID_LINES_FURTHEST = vtkCubeAxesActor.VTK_GRID_LINES_FURTHEST
+_TICKS_INSIDE = vtkCubeAxesActor.VTK_TICKS_INSIDE
+_TICKS_OUTSIDE = vtkCubeAxesActor.VTK_TICKS_OUTSIDE
+_TICKS_BOTH = vtkCubeAxesActor.VTK_TICKS_BOTH
+
+
+@lru_cache(maxsize=256)
+def _rgb(color: str) -> tuple[float, float, float]:
+    """Return the float RGB triple of a color string, memoized across applies."""
     import pyvista as pv
 
-    return {
-        pv.CubeAxesActor.VTK_GRID_LINES_CLOSEST: "all",
-        pv.CubeAxesActor.VTK_GRID_LINES_FURTHEST: "back",
-        pv.CubeAxesActor.VTK_GRID_LINES_ALL: "front",
+    return pv.Color(color).float_rgb
+
+
+def _enum_lookup(pairs: tuple[tuple[int, str], ...]) -> tuple[str, ...]:
+    """Build a tuple of names indexed by their enum value."""
+    names = [""] * (max(value for value, _ in pairs) + 1)
+    for value, name in pairs:
+        names[value] = name
+    return tuple(names)
+
+
+# Grid line / tick location choices indexed by the VTK enum value
+_GRID_LINES_BY_LOCATION = _enum_lookup(
+    ((_GRID_LINES_CLOSEST, "all"), (_GRID_LINES_FURTHEST, "back"), (_GRID_LINES_ALL, "front"))
+)
+_TICKS_BY_LOCATION = _enum_lookup(((_TICKS_INSIDE, "inside"), (_TICKS_OUTSIDE, "outside"), (_TICKS_BOTH, "both")))
+
+
+# Schema rows: (property label, settings key, editor type, extra add_property kwargs)
+AXES_SCHEMA = (
+    ("Line Width", "line_width", "int", {"min": 1, "max": 10}),
+    ("Color", "color", "color", {}),
+    ("X Axis Color", "x_color", "color", {}),
+    ("Y Axis Color", "y_color", "color", {}),
+    ("Z Axis Color", "z_color", "color", {}),
+    ("X Axis Label", "x_label", "string", {}),
+    ("Y Axis Label", "y_label", "string", {}),
+    ("Z Axis Label", "z_label", "string", {}),
+    ("Hide Labels", "labels_off", "bool", {}),
+)
+
+AXES_AT_ORIGIN_SCHEMA = (
+    ("Line Width", "line_width", "int", {"min": 1, "max": 100}),
+    ("X Axis Color", "x_color", "color", {}),
+    ("Y Axis Color", "y_color", "color", {}),
+    ("Z Axis Color", "z_color", "color", {}),
+    ("X Axis Label", "x_label", "string", {}),
+    ("Y Axis Label", "y_label", "string", {}),
+    ("Z Axis Label", "z_label", "string", {}),
+    ("Hide Labels", "labels_off", "bool", {}),
+)
+
+GRID_SCHEMA = (
+    ("Show X Axis", "show_xaxis", "bool", {}),
+    ("Show Y Axis", "show_yaxis", "bool", {}),
+    ("Show Z Axis", "show_zaxis", "bool", {}),
+    ("Show X Labels", "show_xlabels", "bool", {}),
+    ("Show Y Labels", "show_ylabels", "bool", {}),
+    ("Show Z Labels", "show_zlabels", "bool", {}),
+    ("X Title", "xtitle", "string", {}),
+    ("Y Title", "ytitle", "string", {}),
+    ("Z Title", "ztitle", "string", {}),
+    ("Number of X Labels", "n_xlabels", "int", {"min": 1, "max": 20}),
+    ("Number of Y Labels", "n_ylabels", "int", {"min": 1, "max": 20}),
+    ("Number of Z Labels", "n_zlabels", "int", {"min": 1, "max": 20}),
+    ("Grid Lines", "grid", "enum", {"choices": ["all", "back", "front"]}),
+    ("Tick Location", "ticks", "enum", {"choices": ["inside", "outside", "both"]}),
+    ("Minor Ticks", "minor_ticks", "bool", {}),
+)
+
+# Colormap enum choices for the Actors group, built once at import
+ACTORS_COLORMAP_CHOICES = ("mixed", *CMAP_CHOICES)
+
+# Settings keys of the per-actor fields gathered by initialize_actors_settings
+_ACTORS_FIELD_KEYS = ("style", "show_edges", "edge_color", "edge_opacity", "line_width", "opacity")
+
+# Conversion from actors-group tree values to pyvista Property attribute values
+_ACTOR_PROP_CONVERTERS = MappingProxyType(
+    {
+        "style": str,
+        "show_edges": lambda value: value == "True",
+        "edge_color": _rgb,
+        "edge_opacity": float,
+        "line_width": float,
+        "opacity": float,
     }
+)
 
+# Value conversion applied when reading schema-driven groups back from the tree
+_SCHEMA_CONVERTERS = MappingProxyType({"int": int, "float": float, "bool": bool})
 
-def _tick_location_dict() -> dict[int, str]:
-    import pyvista as pv
 
-    return {
-        pv.CubeAxesActor.VTK_TICKS_INSIDE: "inside",
-        pv.CubeAxesActor.VTK_TICKS_OUTSIDE: "outside",
-        pv.CubeAxesActor.VTK_TICKS_BOTH: "both",
+def _schema_fields(group_name: str, schema: tuple) -> tuple[tuple, ...]:
+    """Build the ``(key, address, converter)`` rows used to read a schema group back."""
+    return tuple(
+        (key, f"{group_name}:{label}", _SCHEMA_CONVERTERS.get(editor_type)) for label, key, editor_type, _ in schema
+    )
+
+
+# Static read-back rows of each schema-driven group, keyed by group name
+_SCHEMA_FIELDS = MappingProxyType(
+    {
+        "Axes": _schema_fields("Axes", AXES_SCHEMA),
+        "Axes at Origin": _schema_fields("Axes at Origin", AXES_AT_ORIGIN_SCHEMA),
+        "Grid": _schema_fields("Grid", GRID_SCHEMA),
     }
+)
 
 
 class DisplaySettingsDialog(QDialog):
@@ -106,6 +203,30 @@ class DisplaySettingsDialog(QDialog):
 
         layout.addWidget(self.button_box)
 
+        # The property tree is populated on first show (see showEvent)
+        self._populated = False
+
+        # Snapshot of tree values shared by the current_* properties during one apply
+        self._values_cache: dict | None = None
+
+        # Set while an Apply is queued; repeated clicks in one event-loop turn share it
+        self._apply_pending = False
+
+    def showEvent(self, event) -> None:
+        """Populate the property tree the first time the dialog is shown."""
+        self._ensure_populated()
+        super().showEvent(event)
+
+    def _ensure_populated(self) -> None:
+        """Load settings into the property tree unless already done."""
+        if not self._populated:
+            self._load_settings()
+            self._populated = True
+
+    def _load_settings(self) -> None:
+        """Read the current plotter state and populate the property tree."""
+        self._collect_actors()
+
         # Store initial settings to allow reset if needed
         self.initialize_plotter_settings()
         self.initialize_actors_settings()
@@ -120,102 +241,119 @@ class DisplaySettingsDialog(QDialog):
         self.populate_grid()
         self.populate_actors_settings()
 
+    def _collect_actors(self) -> None:
+        """Scan the renderer actors once for use by the ``initialize_*`` methods."""
+        import pyvista as pv
+
+        self._real_actors = []
+        self._cube_axes = None
+        for actor in self.plotter.renderer.actors.values():
+            if isinstance(actor, pv.Actor):
+                if "scalar" in actor.name:
+                    self._real_actors.append(actor)
+            elif isinstance(actor, pv.CubeAxesActor):
+                self._cube_axes = actor
+
+    def reload_settings(self) -> None:
+        """Rebuild the property tree from the current plotter state.
+
+        Used when a hidden dialog instance is reopened, so the initial settings
+        (and therefore Cancel) reflect changes made since it was last shown.
+        """
+        self.tree.clear()
+        self._populated = False
+        if self.isVisible():
+            self._ensure_populated()
+
     def initialize_plotter_settings(self):
         self.initial_plotter_settings = {
             "background_color": to_hex(self.plotter.renderer.background_color),
         }
 
     def initialize_actors_settings(self):
-        import pyvista as pv
-
-        real_actors = [
-            actor
-            for actor in self.plotter.renderer.actors.values()
-            if (isinstance(actor, pv.Actor) and "scalar" in actor.name)
-        ]
-        # Style
+        real_actors = self._real_actors
         self.initial_actors_settings = {"style": "surface"}
-        actors_styles = [actor.prop.style for actor in real_actors]
-        if actors_styles:
-            # If all actors have the same style, use it; otherwise, set to 'mixed'
-            if all(style == actors_styles[0] for style in actors_styles):
-                self.initial_actors_settings["style"] = actors_styles[0]
-            else:
-                self.initial_actors_settings["style"] = "mixed"
-        # Show edges
-        show_edges = [actor.prop.show_edges for actor in real_actors]
-        if show_edges:
-            if all(show for show in show_edges):
-                self.initial_actors_settings["show_edges"] = "True"
-            elif all(not show for show in show_edges):
-                self.initial_actors_settings["show_edges"] = "False"
-            else:
-                self.initial_actors_settings["show_edges"] = "mixed"
-        # Edge color
-        edge_colors = [to_hex(actor.prop.edge_color) for actor in real_actors]
-        if edge_colors:
-            if all(color == edge_colors[0] for color in edge_colors):
-                self.initial_actors_settings["edge_color"] = edge_colors[0]
-            else:
-                self.initial_actors_settings["edge_color"] = "mixed"
-        # Edge Opacity
-        edge_opacities = [actor.prop.edge_opacity for actor in real_actors]
-        if edge_opacities:
-            if all(opacity == edge_opacities[0] for opacity in edge_opacities):
-                self.initial_actors_settings["edge_opacity"] = edge_opacities[0]
-            else:
-                self.initial_actors_settings["edge_opacity"] = "mixed"
-        # Line Width
-        line_widths = [actor.prop.line_width for actor in real_actors]
-        if line_widths:
-            if all(width == line_widths[0] for width in line_widths):
-                self.initial_actors_settings["line_width"] = line_widths[0]
-            else:
-                self.initial_actors_settings["line_width"] = "mixed"
-        # Colormap
-        cmaps = [
-            actor.mapper.lookup_table.cmap.name for actor in real_actors if (actor.mapper.lookup_table.cmap is not None)
-        ]
-        if cmaps:
-            # If all actors have the same colormap, use it; otherwise, set to 'mixed'
-            if all(cmap == cmaps[0] for cmap in cmaps):
-                self.initial_actors_settings["colormap"] = cmap_name_to_choice(cmaps[0])
-            else:
-                self.initial_actors_settings["colormap"] = "mixed"
-        # Opacity
-        opacities = [actor.prop.opacity for actor in real_actors]
-        if opacities:
-            if all(opacity == opacities[0] for opacity in opacities):
-                self.initial_actors_settings["opacity"] = opacities[0]
-            else:
-                self.initial_actors_settings["opacity"] = "mixed"
+        if not real_actors:
+            return
+
+        # Gather every per-actor field in a single pass, remembering the first
+        # actor's values and whether any later actor differs from them
+        first = None
+        mixed = None
+        cmap_name = None
+        cmap_mixed = False
+        for actor in real_actors:
+            prop = actor.prop
+            values = (
+                prop.style,
+                prop.show_edges,
+                prop.edge_color.float_rgb,
+                prop.edge_opacity,
+                prop.line_width,
+                prop.opacity,
+            )
+            if first is None:
+                first = values
+                mixed = [False] * len(values)
+            elif values != first:
+                # Whole-tuple comparison runs in C; only fall back to per-field
+                # checks for actors that actually differ from the first one
+                for index, value in enumerate(values):
+                    if value != first[index]:
+                        mixed[index] = True
+
+            # Colormap (actors without a colormap are ignored)
+            cmap = actor.mapper.lookup_table.cmap
+            if cmap is not None:
+                if cmap_name is None:
+                    cmap_name = cmap.name
+                elif cmap.name != cmap_name:
+                    cmap_mixed = True
+
+        if first is not None:
+            style, show_edges, edge_color, edge_opacity, line_width, opacity = first
+            self.initial_actors_settings.update(
+                {
+                    "style": style,
+                    "show_edges": str(bool(show_edges)),
+                    "edge_color": to_hex(edge_color),
+                    "edge_opacity": edge_opacity,
+                    "line_width": line_width,
+                    "opacity": opacity,
+                }
+            )
+            for key, is_mixed in zip(_ACTORS_FIELD_KEYS, mixed):
+                if is_mixed:
+                    self.initial_actors_settings[key] = "mixed"
+        if cmap_name is not None:
+            self.initial_actors_settings["colormap"] = "mixed" if cmap_mixed else cmap_name_to_choice(cmap_name)
 
     def initialize_axes_settings(self):
         import pyvista as pv
 
         if self.plotter_window._axes_action.isChecked():
+            axes = self.plotter.renderer.axes_actor
             self.initial_axes_settings = {
                 "enabled": True,
-                "line_width": self.plotter.renderer.axes_actor.GetXAxisShaftProperty().GetLineWidth(),
-                "color": to_hex(
-                    self.plotter.renderer.axes_actor.GetXAxisCaptionActor2D().GetCaptionTextProperty().GetColor()
-                ),
-                "x_color": to_hex(self.plotter.renderer.axes_actor.GetXAxisTipProperty().GetColor()),
-                "y_color": to_hex(self.plotter.renderer.axes_actor.GetYAxisTipProperty().GetColor()),
-                "z_color": to_hex(self.plotter.renderer.axes_actor.GetZAxisTipProperty().GetColor()),
-                "x_label": self.plotter.renderer.axes_actor.GetXAxisLabelText(),
-                "y_label": self.plotter.renderer.axes_actor.GetYAxisLabelText(),
-                "z_label": self.plotter.renderer.axes_actor.GetZAxisLabelText(),
-                "labels_off": self.plotter.renderer.axes_actor.GetAxisLabels() == 0,
+                "line_width": axes.GetXAxisShaftProperty().GetLineWidth(),
+                "color": to_hex(axes.GetXAxisCaptionActor2D().GetCaptionTextProperty().GetColor()),
+                "x_color": to_hex(axes.GetXAxisTipProperty().GetColor()),
+                "y_color": to_hex(axes.GetYAxisTipProperty().GetColor()),
+                "z_color": to_hex(axes.GetZAxisTipProperty().GetColor()),
+                "x_label": axes.GetXAxisLabelText(),
+                "y_label": axes.GetYAxisLabelText(),
+                "z_label": axes.GetZAxisLabelText(),
+                "labels_off": axes.GetAxisLabels() == 0,
             }
         else:
+            theme_axes = pv.global_theme.axes
             self.initial_axes_settings = {
                 "enabled": False,
                 "line_width": 2,
                 "color": "#FFFFFF",
-                "x_color": to_hex(pv.global_theme.axes.x_color),
-                "y_color": to_hex(pv.global_theme.axes.y_color),
-                "z_color": to_hex(pv.global_theme.axes.z_color),
+                "x_color": to_hex(theme_axes.x_color),
+                "y_color": to_hex(theme_axes.y_color),
+                "z_color": to_hex(theme_axes.z_color),
                 "x_label": "X",
                 "y_label": "Y",
                 "z_label": "Z",
@@ -223,27 +361,25 @@ class DisplaySettingsDialog(QDialog):
             }
 
     def initialize_grid_settings(self):
-        grid_visibility_dict = _grid_visibility_dict()
-        tick_location_dict = _tick_location_dict()
-
-        if any(x.__class__.__name__ == "CubeAxesActor" for x in self.plotter.renderer.actors.values()):
+        cube_axes = self._cube_axes
+        if cube_axes is not None:
             self.initial_grid_settings = {
                 "enabled": True,
-                "show_xaxis": self.plotter.renderer.cube_axes_actor.GetXAxisVisibility(),
-                "show_yaxis": self.plotter.renderer.cube_axes_actor.GetYAxisVisibility(),
-                "show_zaxis": self.plotter.renderer.cube_axes_actor.GetZAxisVisibility(),
-                "show_xlabels": self.plotter.renderer.cube_axes_actor.x_label_visibility,
-                "show_ylabels": self.plotter.renderer.cube_axes_actor.y_label_visibility,
-                "show_zlabels": self.plotter.renderer.cube_axes_actor.z_label_visibility,
-                "xtitle": self.plotter.renderer.cube_axes_actor.GetXTitle(),
-                "ytitle": self.plotter.renderer.cube_axes_actor.GetYTitle(),
-                "ztitle": self.plotter.renderer.cube_axes_actor.GetZTitle(),
-                "n_xlabels": self.plotter.renderer.cube_axes_actor.n_xlabels,
-                "n_ylabels": self.plotter.renderer.cube_axes_actor.n_ylabels,
-                "n_zlabels": self.plotter.renderer.cube_axes_actor.n_zlabels,
-                "grid": grid_visibility_dict.get(self.plotter.renderer.cube_axes_actor.GetGridLineLocation()),
-                "ticks": tick_location_dict.get(self.plotter.renderer.cube_axes_actor.GetTickLocation()),
-                "minor_ticks": self.plotter.renderer.cube_axes_actor.x_axis_minor_tick_visibility,
+                "show_xaxis": cube_axes.GetXAxisVisibility(),
+                "show_yaxis": cube_axes.GetYAxisVisibility(),
+                "show_zaxis": cube_axes.GetZAxisVisibility(),
+                "show_xlabels": cube_axes.x_label_visibility,
+                "show_ylabels": cube_axes.y_label_visibility,
+                "show_zlabels": cube_axes.z_label_visibility,
+                "xtitle": cube_axes.GetXTitle(),
+                "ytitle": cube_axes.GetYTitle(),
+                "ztitle": cube_axes.GetZTitle(),
+                "n_xlabels": cube_axes.n_xlabels,
+                "n_ylabels": cube_axes.n_ylabels,
+                "n_zlabels": cube_axes.n_zlabels,
+                "grid": _GRID_LINES_BY_LOCATION[cube_axes.GetGridLineLocation()],
+                "ticks": _TICKS_BY_LOCATION[cube_axes.GetTickLocation()],
+                "minor_ticks": cube_axes.x_axis_minor_tick_visibility,
             }
         else:
             self.initial_grid_settings = {
@@ -282,12 +418,13 @@ class DisplaySettingsDialog(QDialog):
                 "labels_off": actor.GetAxisLabels() == 0,
             }
         else:
+            theme_axes = pv.global_theme.axes
             self.initial_axes_at_origin_settings = {
                 "enabled": False,
                 "line_width": 2,
-                "x_color": to_hex(pv.global_theme.axes.x_color),
-                "y_color": to_hex(pv.global_theme.axes.y_color),
-                "z_color": to_hex(pv.global_theme.axes.z_color),
+                "x_color": to_hex(theme_axes.x_color),
+                "y_color": to_hex(theme_axes.y_color),
+                "z_color": to_hex(theme_axes.z_color),
                 "x_label": "X",
                 "y_label": "Y",
                 "z_label": "Z",
@@ -311,7 +448,7 @@ class DisplaySettingsDialog(QDialog):
         dict
             Dictionary containing all plotter configuration values.
         """
-        values = self.tree.get_all_values()
+        values = self._tree_values()
         return {
             "background_color": values["Background Color"],
         }
@@ -319,69 +456,38 @@ class DisplaySettingsDialog(QDialog):
     def populate_actors_settings(self) -> None:
         """Populate the property tree with all actors settings in the plotter."""
         group = self.tree.add_group(name="Actors")
-
-        self.tree.add_property(
-            name="Style",
-            value=self.initial_actors_settings.get("style", "surface"),
-            editor_type="enum",
-            choices=["surface", "wireframe", "points", "mixed"],
-            parent=group,
-        )
-
-        self.tree.add_property(
-            name="Show Edges",
-            value=self.initial_actors_settings.get("show_edges", "True"),
-            editor_type="enum",
-            choices=["True", "False", "mixed"],
-            parent=group,
-        )
-
-        self.tree.add_property(
-            name="Edge Color",
-            value=self.initial_actors_settings.get("edge_color", "#FFFFFF"),
-            editor_type="color",
-            parent=group,
-        )
-
-        self.tree.add_property(
-            name="Edge Opacity",
-            value=self.initial_actors_settings.get("edge_opacity", 0.3),
-            editor_type="slider",
-            parent=group,
-            min=0.0,
-            max=1.0,
-            decimals=1,
-            steps=10,
-        )
-
-        self.tree.add_property(
-            name="Line Width",
-            value=self.initial_actors_settings.get("line_width", 1),
-            editor_type="float",
-            parent=group,
-            min=0.1,
-            max=10.0,
-            decimals=2,
-            steps=100,
-        )
-
-        self.tree.add_property(
-            name="Colormap",
-            value=self.initial_actors_settings.get("colormap", "viridis"),
-            editor_type="enum",
-            choices=["mixed", *CMAP_CHOICES],
-            parent=group,
-        )
-
-        self.tree.add_property(
-            name="Opacity",
-            value=self.initial_actors_settings.get("opacity", 1.0),
-            editor_type="slider",
+        settings = self.initial_actors_settings
+        self.tree.add_properties(
+            [
+                (
+                    "Style",
+                    settings.get("style", "surface"),
+                    "enum",
+                    {"choices": ["surface", "wireframe", "points", "mixed"]},
+                ),
+                ("Show Edges", settings.get("show_edges", "True"), "enum", {"choices": ["True", "False", "mixed"]}),
+                ("Edge Color", settings.get("edge_color", "#FFFFFF"), "color", {}),
+                (
+                    "Edge Opacity",
+                    settings.get("edge_opacity", 0.3),
+                    "slider",
+                    {"min": 0.0, "max": 1.0, "decimals": 1, "steps": 10},
+                ),
+                (
+                    "Line Width",
+                    settings.get("line_width", 1),
+                    "float",
+                    {"min": 0.1, "max": 10.0, "decimals": 2, "steps": 100},
+                ),
+                ("Colormap", settings.get("colormap", "viridis"), "enum", {"choices": list(ACTORS_COLORMAP_CHOICES)}),
+                (
+                    "Opacity",
+                    settings.get("opacity", 1.0),
+                    "slider",
+                    {"min": 0.0, "max": 1.0, "decimals": 1, "steps": 10},
+                ),
+            ],
             parent=group,
-            min=0.0,
-            max=1.0,
-            decimals=1,
-            steps=10,
         )
 
     @property
@@ -393,7 +499,7 @@ class DisplaySettingsDialog(QDialog):
         dict
             Dictionary containing all actors configuration values.
         """
-        values = self.tree.get_all_values()
+        values = self._tree_values()
         return {
             "style": values["Actors:Style"],
             "show_edges": values["Actors:Show Edges"],
@@ -410,67 +516,7 @@ class DisplaySettingsDialog(QDialog):
         Creates a checkable group with properties for line width, colors, labels,
         and visibility options for the axes display.
         """
-        group = self.tree.add_checkable_group(
-            name="Axes",
-            checked=self.initial_axes_settings["enabled"],
-        )
-        group.setExpanded(self.initial_axes_settings["enabled"])
-        self.tree.add_property(
-            name="Line Width",
-            value=int(self.initial_axes_settings["line_width"]),
-            editor_type="int",
-            parent=group,
-            min=1,
-            max=10,
-        )
-        self.tree.add_property(
-            name="Color",
-            value=self.initial_axes_settings["color"],
-            editor_type="color",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="X Axis Color",
-            value=self.initial_axes_settings["x_color"],
-            editor_type="color",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Y Axis Color",
-            value=self.initial_axes_settings["y_color"],
-            editor_type="color",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Z Axis Color",
-            value=self.initial_axes_settings["z_color"],
-            editor_type="color",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="X Axis Label",
-            value=self.initial_axes_settings["x_label"],
-            editor_type="string",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Y Axis Label",
-            value=self.initial_axes_settings["y_label"],
-            editor_type="string",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Z Axis Label",
-            value=self.initial_axes_settings["z_label"],
-            editor_type="string",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Hide Labels",
-            value=self.initial_axes_settings["labels_off"],
-            editor_type="bool",
-            parent=group,
-        )
+        self._populate_schema_group("Axes", AXES_SCHEMA, self.initial_axes_settings)
 
     @property
     def current_axes_settings(self) -> dict:
@@ -481,19 +527,7 @@ class DisplaySettingsDialog(QDialog):
         dict
             Dictionary containing all axes configuration values.
         """
-        values = self.tree.get_all_values()
-        return {
-            "enabled": bool(values["Axes"]),
-            "line_width": int(values["Axes:Line Width"]),
-            "color": values["Axes:Color"],
-            "x_color": values["Axes:X Axis Color"],
-            "y_color": values["Axes:Y Axis Color"],
-            "z_color": values["Axes:Z Axis Color"],
-            "x_label": values["Axes:X Axis Label"],
-            "y_label": values["Axes:Y Axis Label"],
-            "z_label": values["Axes:Z Axis Label"],
-            "labels_off": bool(values["Axes:Hide Labels"]),
-        }
+        return self._schema_group_settings("Axes")
 
     def populate_axes_at_origin(self) -> None:
         """Populate the property tree with axes at origin settings from the plotter.
@@ -501,61 +535,7 @@ class DisplaySettingsDialog(QDialog):
         Creates a checkable group with properties for line width, colors, and labels
         for the axes displayed at the coordinate system origin.
         """
-        group = self.tree.add_checkable_group(
-            name="Axes at Origin",
-            checked=self.initial_axes_at_origin_settings["enabled"],
-        )
-        group.setExpanded(self.initial_axes_at_origin_settings["enabled"])
-        self.tree.add_property(
-            name="Line Width",
-            value=int(self.initial_axes_at_origin_settings["line_width"]),
-            editor_type="int",
-            parent=group,
-            min=1,
-            max=100,
-        )
-        self.tree.add_property(
-            name="X Axis Color",
-            value=self.initial_axes_at_origin_settings["x_color"],
-            editor_type="color",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Y Axis Color",
-            value=self.initial_axes_at_origin_settings["y_color"],
-            editor_type="color",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Z Axis Color",
-            value=self.initial_axes_at_origin_settings["z_color"],
-            editor_type="color",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="X Axis Label",
-            value=self.initial_axes_at_origin_settings["x_label"],
-            editor_type="string",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Y Axis Label",
-            value=self.initial_axes_at_origin_settings["y_label"],
-            editor_type="string",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Z Axis Label",
-            value=self.initial_axes_at_origin_settings["z_label"],
-            editor_type="string",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Hide Labels",
-            value=self.initial_axes_at_origin_settings["labels_off"],
-            editor_type="bool",
-            parent=group,
-        )
+        self._populate_schema_group("Axes at Origin", AXES_AT_ORIGIN_SCHEMA, self.initial_axes_at_origin_settings)
 
     @property
     def current_axes_at_origin_settings(self) -> dict:
@@ -566,18 +546,7 @@ class DisplaySettingsDialog(QDialog):
         dict
             Dictionary containing all axes at origin configuration values.
         """
-        values = self.tree.get_all_values()
-        return {
-            "enabled": bool(values["Axes at Origin"]),
-            "line_width": int(values["Axes at Origin:Line Width"]),
-            "x_color": values["Axes at Origin:X Axis Color"],
-            "y_color": values["Axes at Origin:Y Axis Color"],
-            "z_color": values["Axes at Origin:Z Axis Color"],
-            "x_label": values["Axes at Origin:X Axis Label"],
-            "y_label": values["Axes at Origin:Y Axis Label"],
-            "z_label": values["Axes at Origin:Z Axis Label"],
-            "labels_off": bool(values["Axes at Origin:Hide Labels"]),
-        }
+        return self._schema_group_settings("Axes at Origin")
 
     def populate_grid(self) -> None:
         """Populate the property tree with grid settings from the plotter.
@@ -585,112 +554,7 @@ class DisplaySettingsDialog(QDialog):
         Creates a checkable group with properties for axis visibility, labels, titles,
         grid lines, tick locations, and other grid display options.
         """
-        grid_visibility_choices = list(_grid_visibility_dict().values())
-        tick_location_choices = list(_tick_location_dict().values())
-
-        group = self.tree.add_checkable_group(
-            name="Grid",
-            checked=self.initial_grid_settings["enabled"],
-        )
-        group.setExpanded(self.initial_grid_settings["enabled"])
-        self.tree.add_property(
-            name="Show X Axis",
-            value=self.initial_grid_settings["show_xaxis"],
-            editor_type="bool",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Show Y Axis",
-            value=self.initial_grid_settings["show_yaxis"],
-            editor_type="bool",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Show Z Axis",
-            value=self.initial_grid_settings["show_zaxis"],
-            editor_type="bool",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Show X Labels",
-            value=self.initial_grid_settings["show_xlabels"],
-            editor_type="bool",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Show Y Labels",
-            value=self.initial_grid_settings["show_ylabels"],
-            editor_type="bool",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Show Z Labels",
-            value=self.initial_grid_settings["show_zlabels"],
-            editor_type="bool",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="X Title",
-            value=self.initial_grid_settings["xtitle"],
-            editor_type="string",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Y Title",
-            value=self.initial_grid_settings["ytitle"],
-            editor_type="string",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Z Title",
-            value=self.initial_grid_settings["ztitle"],
-            editor_type="string",
-            parent=group,
-        )
-        self.tree.add_property(
-            name="Number of X Labels",
-            value=int(self.initial_grid_settings["n_xlabels"]),
-            editor_type="int",
-            parent=group,
-            min=1,
-            max=20,
-        )
-        self.tree.add_property(
-            name="Number of Y Labels",
-            value=int(self.initial_grid_settings["n_ylabels"]),
-            editor_type="int",
-            parent=group,
-            min=1,
-            max=20,
-        )
-        self.tree.add_property(
-            name="Number of Z Labels",
-            value=int(self.initial_grid_settings["n_zlabels"]),
-            editor_type="int",
-            parent=group,
-            min=1,
-            max=20,
-        )
-        self.tree.add_property(
-            name="Grid Lines",
-            value=self.initial_grid_settings["grid"],
-            editor_type="enum",
-            parent=group,
-            choices=grid_visibility_choices,
-        )
-        self.tree.add_property(
-            name="Tick Location",
-            value=self.initial_grid_settings["ticks"],
-            editor_type="enum",
-            parent=group,
-            choices=tick_location_choices,
-        )
-        self.tree.add_property(
-            name="Minor Ticks",
-            value=self.initial_grid_settings["minor_ticks"],
-            editor_type="bool",
-            parent=group,
-        )
+        self._populate_schema_group("Grid", GRID_SCHEMA, self.initial_grid_settings)
 
     @property
     def current_grid_settings(self) -> dict:
@@ -701,49 +565,95 @@ class DisplaySettingsDialog(QDialog):
         dict
             Dictionary containing all grid configuration values.
         """
-        values = self.tree.get_all_values()
-        return {
-            "enabled": bool(values["Grid"]),
-            "show_xaxis": bool(values["Grid:Show X Axis"]),
-            "show_yaxis": bool(values["Grid:Show Y Axis"]),
-            "show_zaxis": bool(values["Grid:Show Z Axis"]),
-            "show_xlabels": bool(values["Grid:Show X Labels"]),
-            "show_ylabels": bool(values["Grid:Show Y Labels"]),
-            "show_zlabels": bool(values["Grid:Show Z Labels"]),
-            "xtitle": values["Grid:X Title"],
-            "ytitle": values["Grid:Y Title"],
-            "ztitle": values["Grid:Z Title"],
-            "n_xlabels": int(values["Grid:Number of X Labels"]),
-            "n_ylabels": int(values["Grid:Number of Y Labels"]),
-            "n_zlabels": int(values["Grid:Number of Z Labels"]),
-            "grid": values["Grid:Grid Lines"],
-            "ticks": values["Grid:Tick Location"],
-            "minor_ticks": bool(values["Grid:Minor Ticks"]),
-        }
+        return self._schema_group_settings("Grid")
+
+    def _populate_schema_group(self, group_name: str, schema: tuple, settings: dict) -> None:
+        """Add a checkable group and one property per schema row.
+
+        Parameters
+        ----------
+        group_name : str
+            Name of the checkable group, also used as address prefix.
+        schema : tuple
+            Rows of ``(label, key, editor_type, extra_kwargs)``.
+        settings : dict
+            Initial settings keyed by the schema keys, plus ``"enabled"``.
+        """
+        group = self.tree.add_checkable_group(name=group_name, checked=settings["enabled"])
+        group.setExpanded(settings["enabled"])
+        specs = []
+        for label, key, editor_type, extra in schema:
+            value = settings[key]
+            if editor_type == "int":
+                value = int(value)
+            specs.append((label, value, editor_type, extra))
+        self.tree.add_properties(specs, parent=group)
+
+    def _schema_group_settings(self, group_name: str) -> dict:
+        """Read the values of a schema-driven group back into a settings dict.
+
+        Property addresses and converters come from the precomputed
+        ``_SCHEMA_FIELDS`` rows, so no address strings are built per call.
+
+        Parameters
+        ----------
+        group_name : str
+            Name of a checkable group added by ``_populate_schema_group``.
+
+        Returns
+        -------
+        dict
+            Settings keyed by the schema keys, plus ``"enabled"``.
+        """
+        values = self._tree_values()
+        settings = {"enabled": bool(values[group_name])}
+        for key, address, converter in _SCHEMA_FIELDS[group_name]:
+            value = values[address]
+            settings[key] = converter(value) if converter is not None else value
+        return settings
 
     def _on_ok(self) -> None:
         """Handle Ok button click - apply changes and close dialog."""
-        self._apply_settings(
-            self.current_plotter_settings,
-            self.current_actors_settings,
-            self.current_axes_settings,
-            self.current_axes_at_origin_settings,
-            self.current_grid_settings,
-        )
+        self._apply_pending = False
+        self._apply_current_settings()
         self.accept()
 
     def _on_apply(self) -> None:
-        """Handle Apply button click - apply changes without closing."""
-        self._apply_settings(
-            self.current_plotter_settings,
-            self.current_actors_settings,
-            self.current_axes_settings,
-            self.current_axes_at_origin_settings,
-            self.current_grid_settings,
-        )
+        """Handle Apply button click - queue an apply without closing."""
+        if not self._apply_pending:
+            self._apply_pending = True
+            QTimer.singleShot(0, self._flush_apply)
+
+    def _flush_apply(self) -> None:
+        """Run the queued apply once, with the tree values current at that time."""
+        if self._apply_pending:
+            self._apply_pending = False
+            self._apply_current_settings()
+
+    def _apply_current_settings(self) -> None:
+        """Apply the settings currently entered in the property tree."""
+        # Read the tree once and share the values across all current_* properties
+        self._values_cache = self.tree.get_all_values()
+        try:
+            self._apply_settings(
+                self.current_plotter_settings,
+                self.current_actors_settings,
+                self.current_axes_settings,
+                self.current_axes_at_origin_settings,
+                self.current_grid_settings,
+            )
+        finally:
+            self._values_cache = None
+
+    def _tree_values(self) -> dict:
+        """Return all property tree values, reusing the per-apply snapshot if set."""
+        if self._values_cache is not None:
+            return self._values_cache
+        return self.tree.get_all_values()
 
     def _on_cancel(self) -> None:
         """Handle Cancel button click - close dialog without applying changes."""
+        self._apply_pending = False
         self._apply_settings(
             self.initial_plotter_settings,
             self.initial_actors_settings,
@@ -775,114 +685,126 @@ class DisplaySettingsDialog(QDialog):
 
         Notes
         -----
-        This method is called by both Ok and Apply buttons.
+        This method is called by Ok, Apply and Cancel. Rendering is suppressed
+        while the settings are pushed and a single render is issued at the end.
         """
-        import pyvista as pv
-
-        # Apply plotter settings
-        self.plotter.renderer.background_color = pv.Color(plotter_settings["background_color"]).float_rgb
-
-        # Apply actors settings
-        # https://github.com/pyvista/pyvista/blob/main/pyvista/plotting/_property.py
-        for actor in self.plotter.renderer.actors.values():
-            if not isinstance(actor, pv.Actor):
-                continue
-            if actors_settings["style"] != "mixed":
-                actor.prop.style = actors_settings["style"]
-            if actors_settings["show_edges"] != "mixed":
-                actor.prop.show_edges = True if actors_settings["show_edges"] == "True" else False
-            if actors_settings["edge_color"] != "mixed":
-                edge_color = pv.Color(actors_settings["edge_color"]).float_rgb
-                actor.prop.edge_color = edge_color
-            if actors_settings["edge_opacity"] != "mixed":
-                actor.prop.edge_opacity = float(actors_settings["edge_opacity"])
-            if actors_settings["line_width"] != "mixed":
-                actor.prop.line_width = float(actors_settings["line_width"])
-            if actors_settings["colormap"] != "mixed":
-                cmap_name = actors_settings["colormap"].split(" : ")[0]
-                actor.mapper.lookup_table.cmap = cmap_name
-            if actors_settings["opacity"] != "mixed":
-                actor.prop.opacity = float(actors_settings["opacity"])
-
-        # Apply axes settings
-        if axes_settings["enabled"]:
-            self.plotter.show_axes()
-            self.plotter_window._axes_action.setChecked(True)
-            self.plotter.renderer.axes_actor.GetXAxisShaftProperty().SetLineWidth(axes_settings["line_width"])
-            self.plotter.renderer.axes_actor.GetYAxisShaftProperty().SetLineWidth(axes_settings["line_width"])
-            self.plotter.renderer.axes_actor.GetZAxisShaftProperty().SetLineWidth(axes_settings["line_width"])
-            label_color = pv.Color(axes_settings["color"]).float_rgb
-            self.plotter.renderer.axes_actor.GetXAxisCaptionActor2D().GetCaptionTextProperty().SetColor(label_color)
-            self.plotter.renderer.axes_actor.GetYAxisCaptionActor2D().GetCaptionTextProperty().SetColor(label_color)
-            self.plotter.renderer.axes_actor.GetZAxisCaptionActor2D().GetCaptionTextProperty().SetColor(label_color)
-            x_color = pv.Color(axes_settings["x_color"]).float_rgb
-            self.plotter.renderer.axes_actor.GetXAxisShaftProperty().SetColor(x_color)
-            y_color = pv.Color(axes_settings["y_color"]).float_rgb
-            self.plotter.renderer.axes_actor.GetYAxisShaftProperty().SetColor(y_color)
-            z_color = pv.Color(axes_settings["z_color"]).float_rgb
-            self.plotter.renderer.axes_actor.GetZAxisShaftProperty().SetColor(z_color)
-            self.plotter.renderer.axes_actor.GetXAxisTipProperty().SetColor(x_color)
-            self.plotter.renderer.axes_actor.GetYAxisTipProperty().SetColor(y_color)
-            self.plotter.renderer.axes_actor.GetZAxisTipProperty().SetColor(z_color)
-            self.plotter.renderer.axes_actor.SetXAxisLabelText(axes_settings["x_label"])
-            self.plotter.renderer.axes_actor.SetYAxisLabelText(axes_settings["y_label"])
-            self.plotter.renderer.axes_actor.SetZAxisLabelText(axes_settings["z_label"])
-            if axes_settings["labels_off"]:
-                self.plotter.renderer.axes_actor.AxisLabelsOff()
+        # Suppress rendering so the setters below trigger a single render
+        self.plotter.suppress_rendering = True
+        try:
+            # Apply plotter settings
+            self.plotter.renderer.background_color = _rgb(plotter_settings["background_color"])
+
+            # Apply actors settings
+            # https://github.com/pyvista/pyvista/blob/main/pyvista/plotting/_property.py
+            mesh_actors = self.plotter_window.get_mesh_actors()
+            if mesh_actors:
+                # Convert the non-mixed values once instead of per actor. Settings
+                # read from a plotter without scalar actors only hold "style", so
+                # absent keys are treated like "mixed" and left untouched.
+                prop_values = {
+                    key: converter(actors_settings[key])
+                    for key, converter in _ACTOR_PROP_CONVERTERS.items()
+                    if actors_settings.get(key, "mixed") != "mixed"
+                }
+                colormap = actors_settings.get("colormap", "mixed")
+                cmap_name = colormap.split(" : ")[0] if colormap != "mixed" else None
+                if prop_values or cmap_name is not None:
+                    for actor in mesh_actors:
+                        prop = actor.prop
+                        for key, value in prop_values.items():
+                            setattr(prop, key, value)
+                        if cmap_name is not None:
+                            actor.mapper.lookup_table.cmap = cmap_name
+
+            # Apply axes settings
+            if axes_settings["enabled"]:
+                self.plotter.show_axes()
+                self.plotter_window._axes_action.setChecked(True)
+                axes_actor = self.plotter.renderer.axes_actor
+                rgb = {key: _rgb(axes_settings[key]) for key in ("color", "x_color", "y_color", "z_color")}
+                for shaft, tip, caption, color_key in (
+                    (
+                        axes_actor.GetXAxisShaftProperty(),
+                        axes_actor.GetXAxisTipProperty(),
+                        axes_actor.GetXAxisCaptionActor2D(),
+                        "x_color",
+                    ),
+                    (
+                        axes_actor.GetYAxisShaftProperty(),
+                        axes_actor.GetYAxisTipProperty(),
+                        axes_actor.GetYAxisCaptionActor2D(),
+                        "y_color",
+                    ),
+                    (
+                        axes_actor.GetZAxisShaftProperty(),
+                        axes_actor.GetZAxisTipProperty(),
+                        axes_actor.GetZAxisCaptionActor2D(),
+                        "z_color",
+                    ),
+                ):
+                    shaft.SetLineWidth(axes_settings["line_width"])
+                    shaft.SetColor(rgb[color_key])
+                    tip.SetColor(rgb[color_key])
+                    caption.GetCaptionTextProperty().SetColor(rgb["color"])
+                axes_actor.SetXAxisLabelText(axes_settings["x_label"])
+                axes_actor.SetYAxisLabelText(axes_settings["y_label"])
+                axes_actor.SetZAxisLabelText(axes_settings["z_label"])
+                if axes_settings["labels_off"]:
+                    axes_actor.AxisLabelsOff()
+                else:
+                    axes_actor.AxisLabelsOn()
             else:
-                self.plotter.renderer.axes_actor.AxisLabelsOn()
-        else:
-            self.plotter.hide_axes()
-            self.plotter_window._axes_action.setChecked(False)
-
-        # Apply axes at origin settings
-        if axes_at_origin_settings["enabled"]:
-            self.plotter_window._toggle_axes_at_origin(True)
-            self.plotter_window._axes_at_origin_action.setChecked(True)
-            actor = self.plotter_window.get_actor_by_name("AxesAtOriginActor")
-            actor.GetXAxisShaftProperty().SetLineWidth(axes_at_origin_settings["line_width"])
-            actor.GetYAxisShaftProperty().SetLineWidth(axes_at_origin_settings["line_width"])
-            actor.GetZAxisShaftProperty().SetLineWidth(axes_at_origin_settings["line_width"])
-            x_color = pv.Color(axes_at_origin_settings["x_color"]).float_rgb
-            y_color = pv.Color(axes_at_origin_settings["y_color"]).float_rgb
-            z_color = pv.Color(axes_at_origin_settings["z_color"]).float_rgb
-            actor.GetXAxisShaftProperty().SetColor(x_color)
-            actor.GetYAxisShaftProperty().SetColor(y_color)
-            actor.GetZAxisShaftProperty().SetColor(z_color)
-            actor.GetXAxisTipProperty().SetColor(x_color)
-            actor.GetYAxisTipProperty().SetColor(y_color)
-            actor.GetZAxisTipProperty().SetColor(z_color)
-            actor.SetXAxisLabelText(axes_at_origin_settings["x_label"])
-            actor.SetYAxisLabelText(axes_at_origin_settings["y_label"])
-            actor.SetZAxisLabelText(axes_at_origin_settings["z_label"])
-            if axes_at_origin_settings["labels_off"]:
-                actor.AxisLabelsOff()
+                self.plotter.hide_axes()
+                self.plotter_window._axes_action.setChecked(False)
+
+            # Apply axes at origin settings
+            if axes_at_origin_settings["enabled"]:
+                self.plotter_window._toggle_axes_at_origin(True)
+                self.plotter_window._axes_at_origin_action.setChecked(True)
+                actor = self.plotter_window.get_actor_by_name("AxesAtOriginActor")
+                rgb = {key: _rgb(axes_at_origin_settings[key]) for key in ("x_color", "y_color", "z_color")}
+                for shaft, tip, color_key in (
+                    (actor.GetXAxisShaftProperty(), actor.GetXAxisTipProperty(), "x_color"),
+                    (actor.GetYAxisShaftProperty(), actor.GetYAxisTipProperty(), "y_color"),
+                    (actor.GetZAxisShaftProperty(), actor.GetZAxisTipProperty(), "z_color"),
+                ):
+                    shaft.SetLineWidth(axes_at_origin_settings["line_width"])
+                    shaft.SetColor(rgb[color_key])
+                    tip.SetColor(rgb[color_key])
+                actor.SetXAxisLabelText(axes_at_origin_settings["x_label"])
+                actor.SetYAxisLabelText(axes_at_origin_settings["y_label"])
+                actor.SetZAxisLabelText(axes_at_origin_settings["z_label"])
+                if axes_at_origin_settings["labels_off"]:
+                    actor.AxisLabelsOff()
+                else:
+                    actor.AxisLabelsOn()
             else:
-                actor.AxisLabelsOn()
-        else:
-            self.plotter_window._toggle_axes_at_origin(False)
-            self.plotter_window._axes_at_origin_action.setChecked(False)
-
-        # Apply grid settings
-        if grid_settings["enabled"]:
-            self.plotter.show_grid(
-                show_xaxis=grid_settings["show_xaxis"],
-                show_yaxis=grid_settings["show_yaxis"],
-                show_zaxis=grid_settings["show_zaxis"],
-                show_xlabels=grid_settings["show_xlabels"],
-                show_ylabels=grid_settings["show_ylabels"],
-                show_zlabels=grid_settings["show_zlabels"],
-                xtitle=grid_settings["xtitle"],
-                ytitle=grid_settings["ytitle"],
-                ztitle=grid_settings["ztitle"],
-                n_xlabels=grid_settings["n_xlabels"],
-                n_ylabels=grid_settings["n_ylabels"],
-                n_zlabels=grid_settings["n_zlabels"],
-                grid=grid_settings["grid"],
-                ticks=grid_settings["ticks"],
-                minor_ticks=grid_settings["minor_ticks"],
-            )
-            self.plotter_window._grid_action.setChecked(True)
-        else:
-            self.plotter.remove_bounds_axes()
-            self.plotter_window._grid_action.setChecked(False)
+                self.plotter_window._toggle_axes_at_origin(False)
+                self.plotter_window._axes_at_origin_action.setChecked(False)
+
+            # Apply grid settings
+            if grid_settings["enabled"]:
+                self.plotter.show_grid(
+                    show_xaxis=grid_settings["show_xaxis"],
+                    show_yaxis=grid_settings["show_yaxis"],
+                    show_zaxis=grid_settings["show_zaxis"],
+                    show_xlabels=grid_settings["show_xlabels"],
+                    show_ylabels=grid_settings["show_ylabels"],
+                    show_zlabels=grid_settings["show_zlabels"],
+                    xtitle=grid_settings["xtitle"],
+                    ytitle=grid_settings["ytitle"],
+                    ztitle=grid_settings["ztitle"],
+                    n_xlabels=grid_settings["n_xlabels"],
+                    n_ylabels=grid_settings["n_ylabels"],
+                    n_zlabels=grid_settings["n_zlabels"],
+                    grid=grid_settings["grid"],
+                    ticks=grid_settings["ticks"],
+                    minor_ticks=grid_settings["minor_ticks"],
+                )
+                self.plotter_window._grid_action.setChecked(True)
+            else:
+                self.plotter.remove_bounds_axes()
+                self.plotter_window._grid_action.setChecked(False)
+        finally:
+            self.plotter.suppress_rendering = False
+        self.plotter.render()
@@ -7,6 +7,7 @@ with monospace formatting and clear functionality.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,6 +19,17 @@ if TYPE_CHECKING:
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QDialog, QHBoxLayout, QPlainTextEdit, QPushButton, QVBoxLayout
 
+# Maximum number of text lines kept in the history display
+_MAX_HISTORY_BLOCKS = 10_000
+# Line closing every history entry
+_SEPARATOR = "-" * 40
+
+
+@lru_cache(maxsize=1)
+def _monospace_font() -> QFont:
+    """Shared monospace font, created on first use once a QApplication exists."""
+    return QFont("Courier", 10)
+
 
 class PickResultHistoryDialog(QDialog):
     """
@@ -62,8 +74,9 @@ class PickResultHistoryDialog(QDialog):
         # Create text display widget with monospace font
         self._text_widget = QPlainTextEdit()
         self._text_widget.setReadOnly(True)
-        monospace_font = QFont("Courier", 10)
-        self._text_widget.setFont(monospace_font)
+        # Drop the oldest lines once the history grows past the cap
+        self._text_widget.setMaximumBlockCount(_MAX_HISTORY_BLOCKS)
+        self._text_widget.setFont(_monospace_font())
         main_layout.addWidget(self._text_widget)
 
         # Create button layout
@@ -104,11 +117,12 @@ class PickResultHistoryDialog(QDialog):
             # Format coordinates with 2 decimal places
             coord_str = f"({coordinates[0]:.2f}, {coordinates[1]:.2f}, {coordinates[2]:.2f})"
 
-            # Build result line
-            result_line = f"Point #{point_id} Block: #{block_str}\n  - Coords: {coord_str}"
-
-            for array_name, array_value in result_dict["highlight_mesh"].point_data.items():
-                result_line += f"\n- {array_name}: {array_value}"
+            # Build result lines
+            parts = [f"Point #{point_id} Block: #{block_str}", f"  - Coords: {coord_str}"]
+            parts.extend(
+                f"- {array_name}: {array_value}"
+                for array_name, array_value in result_dict["highlight_mesh"].point_data.items()
+            )
 
         elif result_type == "Cell":
             cell_id = result_dict.get("cell_id", "?")
@@ -122,20 +136,20 @@ class PickResultHistoryDialog(QDialog):
             # Format coordinates with 2 decimal places
             coord_str = f"({coordinates[0]:.2f}, {coordinates[1]:.2f}, {coordinates[2]:.2f})"
 
-            # Build result line
-            result_line = f"[Cell #{cell_id}] Block: {block_str}\n- Area: {area}"
-
-            for array_name, array_value in result_dict["highlight_mesh"].cell_data.items():
-                result_line += f"\n- {array_name}: {array_value}"
+            # Build result lines
+            parts = [f"[Cell #{cell_id}] Block: {block_str}", f"- Area: {area}"]
+            parts.extend(
+                f"- {array_name}: {array_value}"
+                for array_name, array_value in result_dict["highlight_mesh"].cell_data.items()
+            )
 
         else:
-            result_line = f"[Unknown] {result_dict}"
+            parts = [f"[Unknown] {result_dict}"]
 
-        result_line += "\n"
-        result_line += "-" * 40
+        parts.append(_SEPARATOR)
 
-        # Append to text widget
-        self._text_widget.appendPlainText(result_line)
+        # Append to text widget in one edit
+        self._text_widget.appendPlainText("\n".join(parts))
 
     def clear_history(self) -> None:
         """
@@ -158,6 +158,7 @@ class QtPlotterWindow:
         self._sample_lines_dialog: SampleLinesDialog | None = None
         self._sample_arcs_dialog: SampleArcsDialog | None = None
         self._clip_dialog: ClipDialog | None = None
+        self._display_settings_dialog: DisplaySettingsDialog | None = None
 
         # Action references for toggle behavior
         self._check_point_action: QAction | None = None
@@ -918,13 +919,21 @@ class QtPlotterWindow:
 
     def _open_display_settings(self) -> None:
         """Open display settings dialog (non-blocking)."""
-        display_settings_dialog = DisplaySettingsDialog(plotter=self.plotter, plotter_window=self)
-        display_settings_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        if self._display_settings_dialog is not None:
+            try:
+                if not self._display_settings_dialog.isVisible():
+                    self._display_settings_dialog.reload_settings()
+            except RuntimeError:
+                self._display_settings_dialog = None
+
+        # Create the dialog on first use and keep it for later openings
+        if self._display_settings_dialog is None:
+            self._display_settings_dialog = DisplaySettingsDialog(plotter=self.plotter, plotter_window=self)
 
         # Show and raise dialog (non-blocking)
-        display_settings_dialog.show()
-        display_settings_dialog.raise_()
-        display_settings_dialog.activateWindow()
+        self._display_settings_dialog.show()
+        self._display_settings_dialog.raise_()
+        self._display_settings_dialog.activateWindow()
 
     def _open_scalar_bar_settings_dialog(self) -> None:
         """Open scalar bar settings dialog (non-blocking)."""
@@ -1758,6 +1767,21 @@ class QtPlotterWindow:
                 return actor
         return None
 
+    def get_mesh_actors(self) -> list[pv.Actor]:
+        """
+        Return the ``pv.Actor`` instances among the renderer actors.
+
+        Axes, cube axes, text and other 2D props are skipped.
+
+        Returns
+        -------
+        list[pv.Actor]
+            Mesh actors currently in the renderer.
+        """
+        import pyvista as pv
+
+        return [actor for actor in self.plotter.renderer.actors.values() if isinstance(actor, pv.Actor)]
+
     @property
     def is_closed(self) -> bool:
         """
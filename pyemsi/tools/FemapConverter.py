@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
 import logging
 import math
@@ -11,8 +12,11 @@ import shutil
 import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
+from xml.sax.saxutils import quoteattr
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import pyvista as pv
 
 import numpy as np
@@ -25,6 +29,12 @@ logger = logging.getLogger(__name__)
 
 INTERNAL_FIELD_NAMES: frozenset[str] = frozenset({"vtkOriginalCellIds", "vtkOriginalPointIds"})
 
+# Characters stripped from output set and vector titles before they are used in file or array names
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*!]')
+
+# FEMAP ID lookups use a dense table when max_id < factor * n_ids, and binary search otherwise
+_DENSE_LUT_FACTOR = 8
+
 FORCE_2D_TOPOLOGY = {
     8: 4,  # Brick8 -> Quad4
     12: 5,  # Brick20 -> Quad8
@@ -65,6 +75,152 @@ def _get_femap_to_vtk() -> dict[int, tuple[int, int]]:
     }
 
 
+@lru_cache(maxsize=1)
+def _get_topology_lut() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Dense ``(vtk_types, node_counts)`` arrays indexed by FEMAP topology ID.
+
+    Unsupported topologies have a node count of 0. The arrays are built once
+    and shared, so callers must not modify them.
+    """
+    femap_to_vtk = _get_femap_to_vtk()
+    vtk_types = np.zeros(max(femap_to_vtk) + 1, dtype=np.uint8)
+    node_counts = np.zeros(max(femap_to_vtk) + 1, dtype=np.int64)
+    for topo, (vtk_type, num_nodes) in femap_to_vtk.items():
+        vtk_types[topo] = vtk_type
+        node_counts[topo] = num_nodes
+    return vtk_types, node_counts
+
+
+def _force_2d_topologies(topologies: np.ndarray) -> np.ndarray:
+    """Map 3D FEMAP topologies onto their 2D counterparts from ``FORCE_2D_TOPOLOGY``."""
+    supported = np.isin(topologies, tuple(FORCE_2D_TOPOLOGY))
+    if not supported.all():
+        topo = int(topologies[np.argmin(supported)])
+        raise ValueError(f"Cannot force 2D for element topology {topo}")
+
+    lut = np.zeros(max(FORCE_2D_TOPOLOGY) + 1, dtype=topologies.dtype)
+    lut[list(FORCE_2D_TOPOLOGY)] = list(FORCE_2D_TOPOLOGY.values())
+    return lut[topologies]
+
+
+def _remap_cells(
+    topologies: np.ndarray,
+    connectivity: np.ndarray,
+    offsets: np.ndarray,
+    node_lookup: tuple[np.ndarray, np.ndarray, np.ndarray | None],
+    topology_lut: tuple[np.ndarray, np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Translate flat FEMAP element connectivity into VTK cell arrays.
+
+    ``topology_lut`` is the ``(vtk_types, node_counts)`` pair from
+    :func:`_get_topology_lut`. Elements with an unknown topology, too few nodes, or nodes missing from
+    ``node_lookup`` (see :func:`_id_lookup`) are dropped; surviving elements keep their order and are
+    truncated to the node count VTK expects for their cell type.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        ``(kept, cell_types, cell_offsets, cell_connectivity)`` where ``kept`` indexes
+        the surviving elements and the remaining arrays are ready for ``vtkCellArray.SetData``.
+    """
+    vtk_types, required = topology_lut
+    starts = offsets[:-1].astype(np.int64)
+    counts = np.diff(offsets).astype(np.int64)
+    node_counts = np.zeros(len(topologies), dtype=np.int64)
+    in_range = (topologies >= 0) & (topologies < len(required))
+    node_counts[in_range] = required[topologies[in_range]]
+    kept = np.flatnonzero((node_counts > 0) & (counts >= node_counts))
+
+    node_counts = node_counts[kept]
+    cell_offsets = np.zeros(len(kept) + 1, dtype=np.int64)
+    np.cumsum(node_counts, out=cell_offsets[1:])
+    gather = np.repeat(starts[kept] - cell_offsets[:-1], node_counts) + np.arange(cell_offsets[-1])
+    node_ids = connectivity[gather]
+
+    vtk_ids = _map_ids(node_ids, *node_lookup)
+    found = vtk_ids >= 0
+
+    if len(kept) and not found.all():
+        complete = np.logical_and.reduceat(found, cell_offsets[:-1])
+        vtk_ids = vtk_ids[np.repeat(complete, node_counts)]
+        kept = kept[complete]
+        cell_offsets = np.zeros(len(kept) + 1, dtype=np.int64)
+        np.cumsum(node_counts[complete], out=cell_offsets[1:])
+
+    return kept, vtk_types[topologies[kept]], cell_offsets, vtk_ids.astype(np.int64, copy=False)
+
+
+def _id_lookup(femap_ids: np.ndarray, vtk_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """
+    Build a FEMAP ID -> VTK index lookup from parallel ID and index arrays.
+
+    Returns the ID-sorted ``(femap_ids, vtk_ids)`` pair plus a dense ``-1`` filled
+    table indexed by FEMAP ID when the numbering is compact enough (at most
+    ``_DENSE_LUT_FACTOR`` slots per ID), otherwise ``None``.
+    """
+    order = np.argsort(femap_ids, kind="stable")
+    femap_ids = femap_ids[order]
+    vtk_ids = vtk_ids[order]
+
+    dense = None
+    if len(femap_ids) and femap_ids[0] >= 0 and femap_ids[-1] < _DENSE_LUT_FACTOR * len(femap_ids):
+        dense = np.full(int(femap_ids[-1]) + 1, -1, dtype=np.int32)
+        dense[femap_ids] = vtk_ids
+    return femap_ids, vtk_ids, dense
+
+
+def _sorted_lookup(id_map: dict[int, int]) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Build an :func:`_id_lookup` from a FEMAP ID -> VTK index mapping."""
+    femap_ids = np.fromiter(id_map.keys(), dtype=np.int64, count=len(id_map))
+    vtk_ids = np.fromiter(id_map.values(), dtype=np.int64, count=len(id_map))
+    return _id_lookup(femap_ids, vtk_ids)
+
+
+def _map_ids(keys: np.ndarray, femap_ids: np.ndarray, vtk_ids: np.ndarray, dense: np.ndarray | None) -> np.ndarray:
+    """Map FEMAP IDs to VTK indices through an :func:`_id_lookup`, giving ``-1`` for unknown IDs."""
+    if dense is not None:
+        mapped = np.full(len(keys), -1, dtype=np.int64)
+        in_range = (keys >= 0) & (keys < len(dense))
+        mapped[in_range] = dense[keys[in_range]]
+        return mapped
+
+    if len(femap_ids) == 0:
+        return np.full(len(keys), -1, dtype=np.int64)
+    pos = np.minimum(np.searchsorted(femap_ids, keys), len(femap_ids) - 1)
+    return np.where(femap_ids[pos] == keys, vtk_ids[pos], -1)
+
+
+def _result_arrays(results: dict[int, float]) -> tuple[np.ndarray, np.ndarray]:
+    """Split an output vector's ``results`` mapping into entity ID and value arrays."""
+    entity_ids = np.fromiter(results.keys(), dtype=np.int64, count=len(results))
+    values = np.fromiter(results.values(), dtype=np.float64, count=len(results))
+    return entity_ids, values
+
+
+def _scatter_results(
+    entity_ids: np.ndarray,
+    values: np.ndarray,
+    lookup: tuple[np.ndarray, np.ndarray, np.ndarray | None],
+    size: int,
+) -> np.ndarray:
+    """
+    Scatter FEMAP ID keyed results into a zero-filled float32 array of length ``size``.
+
+    ``lookup`` maps FEMAP IDs to VTK indices (see :func:`_id_lookup`).
+    Results for unknown IDs or out-of-range indices are ignored.
+    """
+    arr = np.zeros(size, dtype=np.float32)
+    if len(entity_ids) == 0:
+        return arr
+
+    idx = _map_ids(entity_ids, *lookup)
+    valid = (idx >= 0) & (idx < size)
+    arr[idx[valid]] = values[valid]
+    return arr
+
+
 class FemapConverter:
     """
     Converts EMSolution's FEMAP Neutral files to VTK MultiBlock UnstructuredGrid format.
@@ -105,6 +261,9 @@ class FemapConverter:
             ascii_mode,
         )
         self.elements_map = {}
+        # FEMAP ID -> VTK index lookups (see _id_lookup), cached by _build_mesh for result scattering
+        self._node_lookup: tuple[np.ndarray, np.ndarray, np.ndarray | None] | None = None
+        self._element_lookup: tuple[np.ndarray, np.ndarray, np.ndarray | None] | None = None
         self.workspace_path = (
             Path(os.path.abspath(os.path.normpath(os.fspath(workspace_path)))) if workspace_path is not None else None
         )
@@ -386,50 +545,100 @@ class FemapConverter:
         logger.debug("Creating output folder: %s", self.output_folder)
         self.output_folder.mkdir(parents=True, exist_ok=True)
 
-        # Build PVD file content
-        pvd_lines = [
-            '<?xml version="1.0"?>',
-            '<VTKFile type="Collection" version="0.1" byte_order="LittleEndian">',
-            "  <Collection>",
-        ]
-        for ts in self.sets.values():
-            safe_title = re.sub(r'[<>:"/\\|?*!]', "", ts["title"])
-            # vtm_path = self.output_folder / f"{safe_title}.vtm"
-            pvd_lines.append(
-                f'    <DataSet timestep="{ts["value"]}" group="" part="0" file="{self.output_name}/{safe_title}.vtm"/>'
-            )
-        pvd_lines.append("  </Collection>")
-        pvd_lines.append("</VTKFile>")
-
+        # Stream PVD file content entry by entry
         with open(self.pvd_file, "w") as f:
-            f.write("\n".join(pvd_lines))
+            f.write('<?xml version="1.0"?>\n')
+            f.write('<VTKFile type="Collection" version="0.1" byte_order="LittleEndian">\n')
+            f.write("  <Collection>\n")
+            for ts in self.sets.values():
+                safe_title = _SANITIZE_RE.sub("", ts["title"])
+                f.write(
+                    f'    <DataSet timestep="{ts["value"]}" group="" part="0" '
+                    f'file="{self.output_name}/{safe_title}.vtm"/>\n'
+                )
+            f.write("  </Collection>\n")
+            f.write("</VTKFile>")
         logger.info("Created PVD file: %s with %d time steps", self.pvd_file, len(self.sets))
 
+    def _configure_xml_writer(self, writer: object) -> None:
+        # 64-bit block headers so arrays larger than 4 GiB stay readable
+        writer.SetHeaderTypeToUInt64()
+        if self.ascii_mode:
+            writer.SetDataModeToAscii()
+        else:
+            # Raw (not base64) appended binary with fast zlib compression
+            writer.SetDataModeToAppended()
+            writer.SetEncodeAppendedData(False)
+            writer.SetCompressorTypeToZLib()
+            writer.SetCompressionLevel(1)
+
     def _write_vtm_file(self, mesh: pv.MultiBlock | pv.UnstructuredGrid, path: str | Path) -> None:
         import pyvista as pv
         from vtk import vtkXMLMultiBlockDataWriter
 
         if isinstance(mesh, pv.UnstructuredGrid):
-            mesh = self._vtu_to_vtm(mesh)
+            self._write_vtm_streaming(mesh, path)
+            return
         writer = vtkXMLMultiBlockDataWriter()
         writer.SetFileName(str(path))
         writer.SetInputData(mesh)
-        if self.ascii_mode:
-            writer.SetDataModeToAscii()
+        self._configure_xml_writer(writer)
         writer.Write()
         logger.debug("Written VTM file: %s", path)
 
-    def _vtu_to_vtm(self, unstructured_grid: pv.UnstructuredGrid) -> pv.MultiBlock:
-        # Create a new MultiBlock dataset based on the PropertyID cell data
-        # Create a MultiBlock dataset and add the subgrid
-        import pyvista as pv
+    def _write_vtm_streaming(self, unstructured_grid: pv.UnstructuredGrid, path: str | Path) -> None:
+        """
+        Write ``unstructured_grid`` as a PropertyID multiblock, one block at a time.
+
+        Produces the same layout as ``vtkXMLMultiBlockDataWriter`` (``<stem>/<stem>_<i>.vtu``
+        pieces plus the ``.vtm`` index), but each block is extracted, written and released
+        before the next one, so the full multiblock is never held in memory.
+        """
+        from vtk import vtkXMLUnstructuredGridWriter
+
+        path = Path(path)
+        stem = path.stem
+        (path.parent / stem).mkdir(parents=True, exist_ok=True)
+
+        writer = vtkXMLUnstructuredGridWriter()
+        self._configure_xml_writer(writer)
+        with open(path, "w") as f:
+            if self.ascii_mode:
+                f.write('<?xml version="1.0"?>\n')
+            f.write(
+                '<VTKFile type="vtkMultiBlockDataSet" version="1.0" byte_order="LittleEndian" '
+                'header_type="UInt64" compressor="vtkZLibDataCompressor">\n'
+            )
+            f.write("  <vtkMultiBlockDataSet>\n")
+            for index, (name, subgrid) in enumerate(self._iter_property_blocks(unstructured_grid)):
+                relative_path = f"{stem}/{stem}_{index}.vtu"
+                writer.SetFileName(str(path.parent / relative_path))
+                writer.SetInputData(subgrid)
+                writer.Write()
+                f.write(f'    <DataSet index="{index}" name={quoteattr(name)} file={quoteattr(relative_path)}/>\n')
+            writer.SetInputData(None)
+            f.write("  </vtkMultiBlockDataSet>\n")
+            f.write("</VTKFile>\n")
+        logger.debug("Written VTM file: %s", path)
+
+    def _iter_property_blocks(
+        self, unstructured_grid: pv.UnstructuredGrid
+    ) -> Iterator[tuple[str, pv.UnstructuredGrid]]:
+        """Yield ``(name, subgrid)`` for each PropertyID block, extracting blocks lazily."""
+        # Bucket cell indices by PropertyID in one stable sort instead of one scan per property
+        property_ids = np.asarray(unstructured_grid.cell_data["PropertyID"])
+        if len(property_ids) and (property_ids == property_ids[0]).all():
+            # Common single-property mesh: one bucket holding every cell, no sort needed
+            buckets = {int(property_ids[0]): np.arange(len(property_ids))}
+        else:
+            order = np.argsort(property_ids, kind="stable")
+            bucket_props, bucket_starts = np.unique(property_ids[order], return_index=True)
+            buckets = dict(zip(bucket_props.tolist(), np.split(order, bucket_starts[1:])))
 
-        logger.debug("Converting UnstructuredGrid to MultiBlock by PropertyID")
-        mb = pv.MultiBlock()
         for prop_id in self.unique_props:
             # Extract cells with the current property ID
-            cell_indices = np.where(unstructured_grid.cell_data["PropertyID"] == prop_id)[0]
-            if len(cell_indices) == 0:
+            cell_indices = buckets.get(int(prop_id))
+            if cell_indices is None:
                 continue
 
             # Create a new UnstructuredGrid for this property
@@ -437,76 +646,63 @@ class FemapConverter:
             subgrid = subgrid.cell_data_to_point_data(pass_cell_data=True)
 
             # Set block name
-            subgrid_name = str(prop_id)
-            mb[subgrid_name] = subgrid
-
-        logger.debug("Created MultiBlock with %d blocks", len(mb))
-        return mb
+            yield str(prop_id), subgrid
 
     def _build_mesh(self, mesh_file: str | Path, force_2d: bool = False) -> None:
         import pyvista as pv
-        from vtk import vtkPoints, vtkUnstructuredGrid
-
-        femap_to_vtk = _get_femap_to_vtk()
+        from vtk import VTK_FLOAT, VTK_UNSIGNED_CHAR, vtkCellArray, vtkPoints, vtkUnstructuredGrid
+        from vtk.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray
 
         logger.info("Building mesh from: %s", mesh_file)
         parser = FEMAPParser(str(mesh_file))
-        nodes = parser.get_nodes(force_2d)
-        elements = parser.get_elements()
-        logger.debug("Loaded %d nodes and %d elements from parser", len(nodes), len(elements))
+        node_ids, node_coords = parser.get_nodes_arrays(force_2d)
+        elem_ids, prop_ids, topologies, connectivity, offsets = parser.get_elements_arrays()
+        logger.debug("Loaded %d nodes and %d elements from parser", len(node_ids), len(elem_ids))
+
+        # Create VTK points and ID mapping, handing all coordinates to VTK at once.
+        # A node ID repeated in the file keeps its last coordinates, as the get_nodes() dict did.
+        order = np.argsort(node_ids, kind="stable")
+        sorted_node_ids = node_ids[order].astype(np.int64)
+        last = np.append(sorted_node_ids[1:] != sorted_node_ids[:-1], True)[: len(sorted_node_ids)]
+        sorted_node_ids = sorted_node_ids[last]
+        # vtkPoints defaults to single precision; keep that so output files are unchanged
+        coords = node_coords[order[last]].astype(np.float32)
 
-        # Create VTK points and ID mapping
         pts = vtkPoints()
-        self.femap_to_vtk_id = {}
+        pts.SetData(numpy_to_vtk(coords, deep=True, array_type=VTK_FLOAT))
+        self.femap_to_vtk_id = dict(zip(sorted_node_ids.tolist(), range(len(sorted_node_ids))))
+        self._node_lookup = _id_lookup(sorted_node_ids, np.arange(len(sorted_node_ids)))
 
-        for vtk_idx, femap_id in enumerate(sorted(nodes.keys())):
-            x, y, z = nodes[femap_id]
-            pts.InsertNextPoint(x, y, z)
-            self.femap_to_vtk_id[femap_id] = vtk_idx
+        if force_2d:
+            topologies = _force_2d_topologies(topologies)
 
-        # Create single unstructured grid
+        kept, cell_types, cell_offsets, cell_connectivity = _remap_cells(
+            topologies, connectivity, offsets, self._node_lookup, _get_topology_lut()
+        )
+
+        # Create single unstructured grid, inserting all cells in one call
+        cells = vtkCellArray()
+        cells.SetData(
+            numpy_to_vtkIdTypeArray(cell_offsets, deep=True), numpy_to_vtkIdTypeArray(cell_connectivity, deep=True)
+        )
         ug = vtkUnstructuredGrid()
         ug.SetPoints(pts)
-        ug.Allocate(len(elements))
+        ug.SetCells(numpy_to_vtk(cell_types, deep=True, array_type=VTK_UNSIGNED_CHAR), cells)
 
-        # Track property IDs for each cell
-        property_ids = []
-        vtk_cell_idx = 0
+        # Track property IDs for each cell as one int32 stream
+        property_ids = prop_ids[kept].astype(np.int32, copy=False)
+        # Store mapping: FEMAP element ID -> VTK cell index
+        self.elements_map.update(zip(elem_ids[kept].tolist(), range(len(kept))))
 
-        for elem in elements:
-            topo = elem["topology"]
-            if force_2d:
-                try:
-                    topo = FORCE_2D_TOPOLOGY[topo]
-                except KeyError as exc:
-                    raise ValueError(f"Cannot force 2D for element topology {topo}") from exc
-
-            if topo not in femap_to_vtk:
-                continue
-
-            vtk_type, num_nodes_required = femap_to_vtk[topo]
-            elem_nodes = elem["nodes"][:num_nodes_required]
-
-            if len(elem_nodes) < num_nodes_required:
-                continue
-
-            try:
-                idlist = [self.femap_to_vtk_id[n] for n in elem_nodes]
-            except KeyError:
-                continue
-
-            ug.InsertNextCell(vtk_type, num_nodes_required, idlist)
-            property_ids.append(elem["prop_id"])
-            # Store mapping: FEMAP element ID -> VTK cell index
-            self.elements_map[elem["id"]] = vtk_cell_idx
-            vtk_cell_idx += 1
+        # Cache the ID lookups reused by get_data_array on every time step
+        self._element_lookup = _sorted_lookup(self.elements_map)
 
         # Convert to PyVista UnstructuredGrid
         self.mesh = pv.wrap(ug)
         self.init_points = self.mesh.points.copy()
 
-        # Add property IDs as cell data
-        self.mesh.cell_data["PropertyID"] = np.array(property_ids, dtype=np.int32)
+        # Add property IDs as cell data in a single array assignment
+        self.mesh.cell_data["PropertyID"] = property_ids
 
         # uniqe property IDs
         self.unique_props = np.unique(property_ids)
@@ -524,7 +720,11 @@ class FemapConverter:
         parser = FEMAPParser(str(file_path))
         parser.parse()
         sets = parser.get_output_sets()
-        self.vectors[name] = parser.get_output_vectors()
+        vectors = parser.get_output_vectors()
+        # Store results as entity ID / value arrays once, rather than converting them every time step
+        for vector in vectors:
+            vector["entity_ids"], vector["values"] = _result_arrays(vector.pop("results"))
+        self.vectors[name] = vectors
         if not self.sets:
             self.sets = sets
         logger.debug(
@@ -577,7 +777,7 @@ class FemapConverter:
         Args:
             mesh: PyVista UnstructuredGrid mesh
             step: Time step / output set ID
-            vectors: List of vector dictionaries from parser
+            vectors: List of vector dictionaries as stored by ``parse_data_file``
 
         Returns:
             Dictionary mapping sanitized vector titles to numpy arrays
@@ -594,44 +794,30 @@ class FemapConverter:
         for matching_vector in matching_vectors:
             title = matching_vector["title"]
             ent_type = matching_vector["ent_type"]
-            results = matching_vector["results"]
+            entity_ids, values = matching_vector["entity_ids"], matching_vector["values"]
 
             # Sanitize title for use as array name
-            safe_title = re.sub(r'[<>:"/\\|?*!]', "_", title) if title else f"Vector_{matching_vector['vec_id']}"
+            safe_title = _SANITIZE_RE.sub("_", title) if title else f"Vector_{matching_vector['vec_id']}"
 
             if ent_type == 8:  # Elemental data
                 num_cells = self.mesh.n_cells
                 if num_cells == 0:
                     continue
 
-                # Create numpy array filled with zeros
-                arr = np.zeros(num_cells, dtype=np.float32)
-
                 # Assign values based on FEMAP element ID using elements_map
-                for elem_id, value in results.items():
-                    if elem_id in self.elements_map:
-                        vtk_idx = self.elements_map[elem_id]
-                        if 0 <= vtk_idx < num_cells:
-                            arr[vtk_idx] = value
-
-                results_dict[safe_title] = arr
+                if self._element_lookup is None:
+                    self._element_lookup = _sorted_lookup(self.elements_map)
+                results_dict[safe_title] = _scatter_results(entity_ids, values, self._element_lookup, num_cells)
 
             elif ent_type == 7:  # Nodal data
                 num_points = self.mesh.n_points
                 if num_points == 0:
                     continue
 
-                # Create numpy array filled with zeros
-                arr = np.zeros(num_points, dtype=np.float32)
-
                 # Assign values based on FEMAP node ID using femap_to_vtk_id
-                for node_id, value in results.items():
-                    if node_id in self.femap_to_vtk_id:
-                        vtk_idx = self.femap_to_vtk_id[node_id]
-                        if 0 <= vtk_idx < num_points:
-                            arr[vtk_idx] = value
-
-                results_dict[safe_title] = arr
+                if self._node_lookup is None:
+                    self._node_lookup = _sorted_lookup(self.femap_to_vtk_id)
+                results_dict[safe_title] = _scatter_results(entity_ids, values, self._node_lookup, num_points)
 
         logger.debug("Extracted %d data arrays for step %d", len(results_dict), step)
         return results_dict
@@ -653,7 +839,7 @@ class FemapConverter:
 
         for step, ts in self.sets.items():
             logger.info("Processing time step %d - %s", step, ts["title"])
-            safe_title = re.sub(r'[<>:"/\\|?*!]', "", ts["title"])
+            safe_title = _SANITIZE_RE.sub("", ts["title"])
             vtm_path = self.output_dir / self.output_name / f"{safe_title}.vtm"
             thread = threading.Thread(target=_time_step_worker, args=(step, vtm_path))
             thread.start()
@@ -695,7 +881,7 @@ class FemapConverter:
             return
         node_2 = data_arrays["DISP-node-2"]
         node_3 = data_arrays["DISP-node-3"]
-        node_vec = np.vstack((node_1, node_2, node_3)).T
+        node_vec = np.column_stack((node_1, node_2, node_3))
         mesh.points = self.init_points + node_vec
         logger.debug("Applied displacement to %d mesh points", mesh.n_points)
 
@@ -705,7 +891,7 @@ class FemapConverter:
         if (element_1 := data_arrays.get("BMAG-elem-1")) is not None:
             element_2 = data_arrays["BMAG-elem-2"]
             element_3 = data_arrays["BMAG-elem-3"]
-            element_vec = np.vstack((element_1, element_2, element_3)).T
+            element_vec = np.column_stack((element_1, element_2, element_3))
             mesh.cell_data["B-Vec (T)"] = element_vec
             element_4 = data_arrays["BMAG-elem-4"]
             mesh.cell_data["B-Mag (T)"] = element_4
@@ -721,7 +907,7 @@ class FemapConverter:
             return
         element_2 = data_arrays["CURR-elem-2"]
         element_3 = data_arrays["CURR-elem-3"]
-        element_vec = np.vstack((element_1, element_2, element_3)).T
+        element_vec = np.column_stack((element_1, element_2, element_3))
         mesh.cell_data["J-Vec (A/m^2)"] = element_vec
         element_4 = data_arrays["CURR-elem-4"]
         mesh.cell_data["J-Mag (A/m^2)"] = element_4
@@ -768,7 +954,7 @@ class FemapConverter:
         if (node_1 := data_arrays.get("ELEC-node-1")) is not None:
             node_2 = data_arrays["ELEC-node-2"]
             node_3 = data_arrays["ELEC-node-3"]
-            mesh.point_data[vector_name] = np.vstack((node_1, node_2, node_3)).T
+            mesh.point_data[vector_name] = np.column_stack((node_1, node_2, node_3))
             mesh.point_data[magnitude_name] = data_arrays["ELEC-node-4"]
             mesh.point_data["Potential (V)"] = data_arrays["ELEC-node-5"]
 
@@ -777,7 +963,7 @@ class FemapConverter:
             return
         element_2 = data_arrays["ELEC-elem-2"]
         element_3 = data_arrays["ELEC-elem-3"]
-        mesh.cell_data[vector_name] = np.vstack((element_1, element_2, element_3)).T
+        mesh.cell_data[vector_name] = np.column_stack((element_1, element_2, element_3))
         mesh.cell_data[magnitude_name] = data_arrays["ELEC-elem-4"]
         mesh.cell_data[scalar_name] = data_arrays["ELEC-elem-5"]
         logger.debug("Added electric field data for step %d", step)
@@ -788,7 +974,7 @@ class FemapConverter:
         if (node_1 := data_arrays.get("NFOR-node-1")) is not None:
             node_2 = data_arrays["NFOR-node-2"]
             node_3 = data_arrays["NFOR-node-3"]
-            node_vec = np.vstack((node_1, node_2, node_3)).T
+            node_vec = np.column_stack((node_1, node_2, node_3))
             mesh.point_data["F Nodal-Vec (N/m^3)"] = node_vec
             node_4 = data_arrays["NFOR-node-4"]
             mesh.point_data["F Nodal-Mag (N/m^3)"] = node_4
@@ -797,7 +983,7 @@ class FemapConverter:
             return
         element_2 = data_arrays["NFOR-elem-2"]
         element_3 = data_arrays["NFOR-elem-3"]
-        element_vec = np.vstack((element_1, element_2, element_3)).T
+        element_vec = np.column_stack((element_1, element_2, element_3))
         mesh.cell_data["F Nodal-Vec (N/m^3)"] = element_vec
         element_4 = data_arrays["NFOR-elem-4"]
         mesh.cell_data["F Nodal-Mag (N/m^3)"] = element_4
@@ -809,7 +995,7 @@ class FemapConverter:
         if (node_1 := data_arrays.get("LFOR-node-1")) is not None:
             node_2 = data_arrays["LFOR-node-2"]
             node_3 = data_arrays["LFOR-node-3"]
-            node_vec = np.vstack((node_1, node_2, node_3)).T
+            node_vec = np.column_stack((node_1, node_2, node_3))
             mesh.point_data["F Lorents-Vec (N/m^3)"] = node_vec
             node_4 = data_arrays["LFOR-node-4"]
             mesh.point_data["F Lorents-Mag (N/m^3)"] = node_4
@@ -818,7 +1004,7 @@ class FemapConverter:
             return
         element_2 = data_arrays["LFOR-elem-2"]
         element_3 = data_arrays["LFOR-elem-3"]
-        element_vec = np.vstack((element_1, element_2, element_3)).T
+        element_vec = np.column_stack((element_1, element_2, element_3))
         mesh.cell_data["F Lorents-Vec (N/m^3)"] = element_vec
         element_4 = data_arrays["LFOR-elem-4"]
         mesh.cell_data["F Lorents-Mag (N/m^3)"] = element_4
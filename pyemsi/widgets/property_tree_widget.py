@@ -282,6 +282,50 @@ class PropertyTreeWidget(QTreeWidget):
 
         return item
 
+    def add_properties(
+        self,
+        specs: List[tuple],
+        parent: Optional[QTreeWidgetItem] = None,
+    ) -> List[QTreeWidgetItem]:
+        """Add several properties in one batch with repaints and signals suspended.
+
+        Args:
+            specs: Sequence of ``(name, value, editor_type, kwargs)`` tuples, where
+                kwargs is a dict of additional :meth:`add_property` arguments
+            parent: Optional parent group item shared by all properties
+
+        Returns:
+            List of created QTreeWidgetItem, in the order of ``specs``
+
+        Raises:
+            ValueError: If a name contains colon character or if an address already exists
+
+        Example:
+            >>> group = tree.add_group("Mesh")
+            >>> tree.add_properties(
+            ...     [
+            ...         ("opacity", 1.0, "float", {"min": 0.0, "max": 1.0}),
+            ...         ("show_edges", True, "bool", {}),
+            ...     ],
+            ...     parent=group,
+            ... )
+        """
+        # Restore the caller's state so nested batches keep their own suspension
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        signals_blocked = self.blockSignals(True)
+        try:
+            items = [
+                self.add_property(name, value, editor_type, parent=parent, **kwargs)
+                for name, value, editor_type, kwargs in specs
+            ]
+        finally:
+            self.blockSignals(signals_blocked)
+            self.setUpdatesEnabled(updates_enabled)
+        if updates_enabled:
+            self.viewport().update()
+        return items
+
     def add_group(self, name: str) -> QTreeWidgetItem:
         """Add a property group (parent item) with bold font.
 
@@ -387,6 +431,17 @@ class PropertyTreeWidget(QTreeWidget):
 
         return group
 
+    def clear(self):
+        """Remove all items and forget their property addresses.
+
+        Example:
+            >>> tree.clear()
+            >>> tree.get_all_addresses()
+            []
+        """
+        super().clear()
+        self._property_items.clear()
+
     def _get_group_children(self, group_item: QTreeWidgetItem) -> List[QTreeWidgetItem]:
         """Get all direct children of a group item.
 
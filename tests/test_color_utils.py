@@ -0,0 +1,8 @@
+from pyemsi.plotter.color_utils import to_hex
+
+
+def test_to_hex_does_not_depend_on_call_order():
+    assert to_hex((1.0, 0.0, 0.0)) == "#FF0000"
+    assert to_hex((1, 0, 0)) == "#010000"
+    assert to_hex((1.0, 0.0, 0.0)) == "#FF0000"
+
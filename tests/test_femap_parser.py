@@ -62,6 +62,16 @@ class TestFEMAPParser(unittest.TestCase):
         self.assertEqual(nodes[3], (1.0, 1.0, 0.0))
         self.assertEqual(nodes[8], (0.0, 1.0, 1.0))
 
+    def test_get_nodes_arrays(self):
+        """Test array node extraction matches the dictionary API."""
+        parser = FEMAPParser(self.simple_mesh)
+        for force_2d in (False, True):
+            ids, coords = parser.get_nodes_arrays(force_2d)
+            nodes = parser.get_nodes(force_2d)
+
+            self.assertEqual(coords.shape, (len(ids), 3))
+            self.assertEqual(dict(zip(ids.tolist(), map(tuple, coords.tolist()))), nodes)
+
     def test_get_properties(self):
         """Test property extraction."""
         parser = FEMAPParser(self.simple_mesh)
@@ -87,6 +97,34 @@ class TestFEMAPParser(unittest.TestCase):
         self.assertEqual(len(elem["nodes"]), 8)
         self.assertEqual(elem["nodes"], [1, 2, 3, 4, 5, 6, 7, 8])
 
+    def test_get_elements_arrays(self):
+        """Test array element extraction matches the dictionary API."""
+        parser = FEMAPParser(self.mixed_mesh)
+        parser.parse()
+        ids, prop_ids, topologies, connectivity, offsets = parser.get_elements_arrays()
+        elements = parser.get_elements()
+
+        self.assertEqual(len(offsets), len(ids) + 1)
+        self.assertEqual(ids.tolist(), [elem["id"] for elem in elements])
+        self.assertEqual(prop_ids.tolist(), [elem["prop_id"] for elem in elements])
+        self.assertEqual(topologies.tolist(), [elem["topology"] for elem in elements])
+        for k, elem in enumerate(elements):
+            self.assertEqual(connectivity[offsets[k] : offsets[k + 1]].tolist(), elem["nodes"])
+
+    def test_getters_are_memoized(self):
+        """Test repeated getter calls reuse results until invalidated."""
+        parser = FEMAPParser(self.simple_mesh)
+        nodes = parser.get_nodes()
+        elements = parser.get_elements()
+
+        self.assertIs(parser.get_nodes(), nodes)
+        self.assertIs(parser.get_elements(), elements)
+        self.assertIsNot(parser.get_nodes(force_2d=True), nodes)
+
+        parser.invalidate()
+        self.assertIsNot(parser.get_nodes(), nodes)
+        self.assertEqual(parser.get_nodes(), nodes)
+
     def test_get_materials(self):
         """Test material extraction."""
         parser = FEMAPParser(self.simple_mesh)
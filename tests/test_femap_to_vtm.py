@@ -7,10 +7,11 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pyvista as pv
 from vtk import VTK_QUAD, vtkXMLMultiBlockDataReader
 
-from pyemsi.tools.FemapConverter import FEMAP_TO_VTK, FemapConverter
+from pyemsi.tools.FemapConverter import FemapConverter, _get_femap_to_vtk
 
 
 class TestFemapConverter(unittest.TestCase):
@@ -79,11 +80,17 @@ class TestFemapConverter(unittest.TestCase):
             def __init__(self, _path):
                 pass
 
-            def get_nodes(self, _force_2d):
-                return {1: (0.0, 0.0, 0.0)}
+            def get_nodes_arrays(self, _force_2d):
+                return np.array([1], dtype=np.int32), np.zeros((1, 3))
 
-            def get_elements(self):
-                return [{"id": 1, "topology": 9, "nodes": [1], "prop_id": 1}]
+            def get_elements_arrays(self):
+                return (
+                    np.array([1], dtype=np.int32),
+                    np.array([1], dtype=np.int32),
+                    np.array([9], dtype=np.int32),
+                    np.array([1], dtype=np.int32),
+                    np.array([0, 1], dtype=np.int32),
+                )
 
         converter = self._make_converter(self.simple_mesh)
 
@@ -91,26 +98,25 @@ class TestFemapConverter(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, "Cannot force 2D"):
                 converter._build_mesh("ignored.neu", force_2d=True)
 
-    def test_vtu_to_vtm_groups_cells_by_property(self):
-        """Test conversion from unstructured grid to multiblock groups by PropertyID."""
+    def test_iter_property_blocks_groups_cells_by_property(self):
+        """Test the unstructured grid is split into one block per PropertyID."""
         converter = self._make_converter(self.simple_mesh)
         converter._build_mesh(converter._mesh_file)
-        mb = converter._vtu_to_vtm(converter.mesh)
+        blocks = list(converter._iter_property_blocks(converter.mesh))
 
-        self.assertIsInstance(mb, pv.MultiBlock)
-        self.assertGreater(len(mb), 0)
+        self.assertEqual([name for name, _ in blocks], ["1"])
 
-        block0 = mb[0]
+        block0 = blocks[0][1]
+        self.assertIsInstance(block0, pv.UnstructuredGrid)
         self.assertEqual(block0.n_points, 8)
         self.assertEqual(block0.n_cells, 1)
 
     def test_cell_data_in_blocks(self):
-        """Test multiblock conversion retains current PropertyID cell data."""
+        """Test property blocks retain current PropertyID cell data."""
         converter = self._make_converter(self.simple_mesh)
         converter._build_mesh(converter._mesh_file)
-        mb = converter._vtu_to_vtm(converter.mesh)
+        _, block0 = next(converter._iter_property_blocks(converter.mesh))
 
-        block0 = mb[0]
         self.assertIn("PropertyID", block0.cell_data)
 
     def test_write_vtm(self):
@@ -137,26 +143,33 @@ class TestFemapConverter(unittest.TestCase):
                 os.unlink(output_file)
 
     def test_mixed_elements_conversion(self):
-        """Test conversion of a mixed-element mesh into grouped multiblock output."""
+        """Test a mixed-element mesh is streamed into one block per PropertyID."""
         converter = self._make_converter(self.mixed_mesh)
         converter._build_mesh(converter._mesh_file)
-        mb = converter._vtu_to_vtm(converter.mesh)
+        output_file = Path(self._make_output_dir()) / "mixed.vtm"
+        converter._write_vtm_streaming(converter.mesh, output_file)
 
-        self.assertGreater(len(mb), 0)
+        reader = vtkXMLMultiBlockDataReader()
+        reader.SetFileName(str(output_file))
+        reader.Update()
+        mb = reader.GetOutput()
 
-        total_cells = sum(block.n_cells for block in mb)
+        self.assertEqual(mb.GetNumberOfBlocks(), len(converter.unique_props))
+        total_cells = sum(mb.GetBlock(i).GetNumberOfCells() for i in range(mb.GetNumberOfBlocks()))
         self.assertEqual(total_cells, 3)
 
     def test_topology_mapping(self):
         """Test FEMAP to VTK topology mapping."""
+        femap_to_vtk = _get_femap_to_vtk()
+
         # Verify key mappings exist
-        self.assertIn(8, FEMAP_TO_VTK)  # Brick8
-        self.assertIn(6, FEMAP_TO_VTK)  # Tetra4
-        self.assertIn(2, FEMAP_TO_VTK)  # Tri3
-        self.assertIn(4, FEMAP_TO_VTK)  # Quad4
+        self.assertIn(8, femap_to_vtk)  # Brick8
+        self.assertIn(6, femap_to_vtk)  # Tetra4
+        self.assertIn(2, femap_to_vtk)  # Tri3
+        self.assertIn(4, femap_to_vtk)  # Quad4
 
         # Verify mapping structure
-        vtk_type, num_nodes = FEMAP_TO_VTK[8]
+        vtk_type, num_nodes = femap_to_vtk[8]
         self.assertEqual(vtk_type, 12)  # VTK_HEXAHEDRON
         self.assertEqual(num_nodes, 8)
 
@@ -183,9 +196,8 @@ class TestFemapConverter(unittest.TestCase):
         """Test that current cell data values are preserved after grouping."""
         converter = self._make_converter(self.simple_mesh)
         converter._build_mesh(converter._mesh_file)
-        mb = converter._vtu_to_vtm(converter.mesh)
+        _, block0 = next(converter._iter_property_blocks(converter.mesh))
 
-        block0 = mb[0]
         prop_ids = block0.cell_data["PropertyID"]
 
         self.assertEqual(int(prop_ids[0]), 1)
@@ -210,12 +222,13 @@ class TestTopologyMapping(unittest.TestCase):
     def test_all_topologies_defined(self):
         """Test that all common topologies are defined."""
         expected_topologies = [0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
+        femap_to_vtk = _get_femap_to_vtk()
         for topo in expected_topologies:
-            self.assertIn(topo, FEMAP_TO_VTK, f"Topology {topo} not in mapping")
+            self.assertIn(topo, femap_to_vtk, f"Topology {topo} not in mapping")
 
     def test_node_counts(self):
         """Test that node counts are reasonable."""
-        for topo, (vtk_type, num_nodes) in FEMAP_TO_VTK.items():
+        for topo, (vtk_type, num_nodes) in _get_femap_to_vtk().items():
             self.assertGreater(num_nodes, 0, f"Invalid node count for topology {topo}")
             self.assertLessEqual(num_nodes, 20, f"Unexpected node count for topology {topo}")
 